@@ -4,7 +4,7 @@ Wählt die passende KI-Strategie basierend auf Charakterdaten (insbesondere ai_s
 Erstellt und gibt eine Instanz der entsprechenden Strategieklasse zurück.
 """
 import logging
-from typing import Optional, List, Dict, Any, Type 
+from typing import Optional, List, Dict, Any, Type, Callable
 
 from src.ai.strategies.basic_melee import BasicMeleeStrategy
 from src.ai.strategies.basic_ranged import BasicRangedStrategy
@@ -43,6 +43,28 @@ def _ensure_definitions_loaded():
             logger.critical(f"Fehler beim Laden der Charakter-Definitionen im AI Dispatcher: {e}")
             _CHARACTER_DEFINITIONS = {} 
 
+def _create_basic_melee(actor: 'CharacterInstance', all_entities_in_combat: List['CharacterInstance']) -> Optional[Any]:
+    return BasicMeleeStrategy(actor=actor, skill_definitions=_SKILL_DEFINITIONS)
+
+def _create_basic_ranged(actor: 'CharacterInstance', all_entities_in_combat: List['CharacterInstance']) -> Optional[Any]:
+    if not _CHARACTER_DEFINITIONS: 
+        logger.error(f"Charakter-Definitionen nicht geladen, kann BasicRangedStrategy nicht erstellen.")
+        return None
+    return BasicRangedStrategy(actor=actor, skill_definitions=_SKILL_DEFINITIONS, character_definitions=_CHARACTER_DEFINITIONS)
+
+def _create_support_caster(actor: 'CharacterInstance', all_entities_in_combat: List['CharacterInstance']) -> Optional[Any]:
+    return SupportCasterStrategy(actor=actor, 
+                                 all_entities_in_combat=all_entities_in_combat, 
+                                 skill_definitions=_SKILL_DEFINITIONS,
+                                 character_definitions=_CHARACTER_DEFINITIONS or {})
+
+# Strategieklasse -> Fabrikfunktion (actor, all_entities_in_combat); ein Dict-Lookup statt if/elif-Kette
+_STRATEGY_FACTORIES: Dict[Type[Any], Callable[['CharacterInstance', List['CharacterInstance']], Optional[Any]]] = {
+    BasicMeleeStrategy: _create_basic_melee,
+    BasicRangedStrategy: _create_basic_ranged,
+    SupportCasterStrategy: _create_support_caster,
+}
+
 def get_ai_strategy_instance(actor: 'CharacterInstance', 
                                all_entities_in_combat: List['CharacterInstance']) -> Optional[Any]:
     _ensure_definitions_loaded() 
@@ -56,7 +78,7 @@ def get_ai_strategy_instance(actor: 'CharacterInstance',
         strategy_id = actor.base_template.ai_strategy_id
     
     if not strategy_id:
-        logger.warning(f"Akteur '{actor.name}' hat keine 'ai_strategy_id' in seinem Template. Keine Strategie verwendet.")
+        logger.warning("Akteur '%s' hat keine 'ai_strategy_id' in seinem Template. Keine Strategie verwendet.", actor.name)
         return None 
 
     strategy_class = STRATEGY_MAP.get(strategy_id)
@@ -66,23 +88,16 @@ def get_ai_strategy_instance(actor: 'CharacterInstance',
         return None
 
     try:
-        if strategy_class is BasicMeleeStrategy:
-            instance = strategy_class(actor=actor, skill_definitions=_SKILL_DEFINITIONS)
-        elif strategy_class is BasicRangedStrategy:
-            if not _CHARACTER_DEFINITIONS: 
-                logger.error(f"Charakter-Definitionen nicht geladen, kann BasicRangedStrategy nicht erstellen.")
+        factory = _STRATEGY_FACTORIES.get(strategy_class)
+        if factory is not None:
+            instance = factory(actor, all_entities_in_combat)
+            if instance is None:
                 return None
-            instance = strategy_class(actor=actor, skill_definitions=_SKILL_DEFINITIONS, character_definitions=_CHARACTER_DEFINITIONS)
-        elif strategy_class is SupportCasterStrategy:
-            instance = strategy_class(actor=actor, 
-                                      all_entities_in_combat=all_entities_in_combat, 
-                                      skill_definitions=_SKILL_DEFINITIONS,
-                                      character_definitions=_CHARACTER_DEFINITIONS or {}) 
         else:
-            logger.warning(f"Strategieklasse '{strategy_class.__name__}' hat keinen spezifischen Instanziierungs-Pfad im Dispatcher. Versuche generische Instanziierung.")
+            logger.warning("Strategieklasse '%s' hat keinen spezifischen Instanziierungs-Pfad im Dispatcher. Versuche generische Instanziierung.", strategy_class.__name__)
             instance = strategy_class(actor=actor, skill_definitions=_SKILL_DEFINITIONS) 
             
-        logger.info(f"KI-Strategie '{strategy_class.__name__}' für Akteur '{actor.name}' (ID: {strategy_id}) instanziiert.")
+        logger.info("KI-Strategie '%s' für Akteur '%s' (ID: %s) instanziiert.", strategy_class.__name__, actor.name, strategy_id)
         return instance
     except Exception as e:
         logger.error(f"Fehler bei der Instanziierung der KI-Strategie '{strategy_class.__name__}' für Akteur '{actor.name}': {e}", exc_info=True) # exc_info hinzugefügt
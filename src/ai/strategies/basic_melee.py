@@ -8,6 +8,12 @@ from src.definitions.skill import SkillTemplate
 
 logger = logging.getLogger(__name__)
 
+# Einmal auf Modulebene statt bei jedem Aufruf der Schadensabschätzung importieren
+try:
+    from src.config.config import CONFIG
+except ImportError:
+    CONFIG = None
+
 class BasicMeleeStrategy:
     def __init__(self, actor: 'CharacterInstance', skill_definitions: Dict[str, 'SkillTemplate']):
         self.actor = actor
@@ -19,12 +25,8 @@ class BasicMeleeStrategy:
             return True
         # Berücksichtige Skills, die Waffenschaden nutzen (base_damage: null)
         if skill and skill.direct_effects and skill.direct_effects.base_damage is None:
-             try:
-                 from src.config.config import CONFIG
-                 if CONFIG and CONFIG.get("game_settings.base_weapon_damage") is not None:
-                     return True
-             except ImportError:
-                 pass # CONFIG nicht verfügbar, kann nicht geprüft werden
+             if CONFIG and CONFIG.get("game_settings.base_weapon_damage") is not None:
+                 return True
         return False
 
     def _get_skill_potential_damage(self, skill_id: str) -> int:
@@ -33,11 +35,6 @@ class BasicMeleeStrategy:
             return 0
 
         base_damage_val = 0
-        try:
-            from src.config.config import CONFIG
-        except ImportError:
-            CONFIG = None
-            
         if skill.direct_effects.base_damage is None:
             if CONFIG and hasattr(CONFIG, 'get'):
                 base_damage_val = CONFIG.get("game_settings.base_weapon_damage", 5)
@@ -58,13 +55,12 @@ class BasicMeleeStrategy:
         if not valid_targets: return None
 
         if random.random() < 0.80:
-            valid_targets.sort(key=lambda t: (t.current_hp / t.max_hp) if t.max_hp > 0 else float('inf'))
-            chosen_target = valid_targets[0]
-            logger.debug(f"'{self.actor.name}' (BasicMelee) wählt schwächstes Ziel: '{chosen_target.name}'")
+            chosen_target = min(valid_targets, key=lambda t: (t.current_hp / t.max_hp) if t.max_hp > 0 else float('inf')) # Nur das Minimum wird gebraucht, kein Sortieren
+            logger.debug("'%s' (BasicMelee) wählt schwächstes Ziel: '%s'", self.actor.name, chosen_target.name)
             return chosen_target
         else:
             chosen_target = random.choice(valid_targets)
-            logger.debug(f"'{self.actor.name}' (BasicMelee) wählt zufälliges Ziel: '{chosen_target.name}'.")
+            logger.debug("'%s' (BasicMelee) wählt zufälliges Ziel: '%s'.", self.actor.name, chosen_target.name)
             return chosen_target
 
     def choose_skill(self, available_skills: List[str], target: Optional['CharacterInstance']) -> Optional[str]:
@@ -84,30 +80,29 @@ class BasicMeleeStrategy:
                     non_offensive_usable_skills.append(skill_id)
             if non_offensive_usable_skills:
                 chosen_skill_id = random.choice(non_offensive_usable_skills)
-                logger.debug(f"'{self.actor.name}' (BasicMelee) wählt nicht-offensiven Skill: '{chosen_skill_id}'.")
+                logger.debug("'%s' (BasicMelee) wählt nicht-offensiven Skill: '%s'.", self.actor.name, chosen_skill_id)
                 return chosen_skill_id
             return None
 
         if random.random() < 0.70:
-            offensive_skills.sort(key=lambda s_id: self._get_skill_potential_damage(s_id), reverse=True)
-            chosen_skill_id = offensive_skills[0]
-            logger.debug(f"'{self.actor.name}' (BasicMelee) wählt stärksten Skill: '{chosen_skill_id}'.")
+            chosen_skill_id = max(offensive_skills, key=self._get_skill_potential_damage) # Erstes Maximum wie zuvor nach stabiler Sortierung
+            logger.debug("'%s' (BasicMelee) wählt stärksten Skill: '%s'.", self.actor.name, chosen_skill_id)
         else:
             chosen_skill_id = random.choice(offensive_skills)
-            logger.debug(f"'{self.actor.name}' (BasicMelee) wählt zufälligen offensiven Skill: '{chosen_skill_id}'.")
+            logger.debug("'%s' (BasicMelee) wählt zufälligen offensiven Skill: '%s'.", self.actor.name, chosen_skill_id)
         return chosen_skill_id
 
     def decide_action(self, potential_targets: List['CharacterInstance']) -> Optional[Tuple[str, 'CharacterInstance']]:
         if not self.actor or self.actor.is_defeated or not self.actor.can_act: return None
         target = self.choose_target(potential_targets)
         if not target:
-            logger.debug(f"'{self.actor.name}' (BasicMelee) findet kein Ziel.")
+            logger.debug("'%s' (BasicMelee) findet kein Ziel.", self.actor.name)
             return None
         skill_id = self.choose_skill(self.actor.skills, target)
         if not skill_id:
-            logger.debug(f"'{self.actor.name}' (BasicMelee) konnte keinen Skill auswählen.")
+            logger.debug("'%s' (BasicMelee) konnte keinen Skill auswählen.", self.actor.name)
             return None
-        logger.debug(f"'{self.actor.name}' (BasicMelee) entscheidet sich für Skill '{skill_id}' auf Ziel '{target.name}'.") # KORREKTUR: DEBUG statt INFO
+        logger.debug("'%s' (BasicMelee) entscheidet sich für Skill '%s' auf Ziel '%s'.", self.actor.name, skill_id, target.name) # KORREKTUR: DEBUG statt INFO
         return skill_id, target
 
 # ... (if __name__ == '__main__' Block bleibt gleich)
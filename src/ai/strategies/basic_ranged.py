@@ -10,6 +10,12 @@ from src.definitions.opponent import OpponentTemplate # Import für Typ-Check
 
 logger = logging.getLogger(__name__)
 
+# Einmal auf Modulebene statt bei jedem Aufruf der Schadensabschätzung importieren
+try:
+    from src.config.config import CONFIG
+except ImportError:
+    CONFIG = None
+
 class BasicRangedStrategy:
     def __init__(self, actor: 'CharacterInstance', skill_definitions: Dict[str, 'SkillTemplate'], character_definitions: Dict[str, 'CharacterTemplate']):
         self.actor = actor
@@ -33,8 +39,6 @@ class BasicRangedStrategy:
 
     def _get_skill_potential_damage(self, skill_id: str) -> int:
         skill = self.skill_definitions.get(skill_id)
-        try: from src.config.config import CONFIG
-        except ImportError: CONFIG = None
 
         base_damage_val = 0
         is_offensive = False
@@ -67,15 +71,14 @@ class BasicRangedStrategy:
 
         if caster_targets and random.random() < 0.70:
             chosen_target = random.choice(caster_targets)
-            logger.debug(f"'{self.actor.name}' (BasicRanged) wählt Caster-Ziel: '{chosen_target.name}'.")
+            logger.debug("'%s' (BasicRanged) wählt Caster-Ziel: '%s'.", self.actor.name, chosen_target.name)
         else:
             if random.random() < 0.60:
-                valid_targets.sort(key=lambda t: (t.current_hp / t.max_hp) if t.max_hp > 0 else float('inf'))
-                chosen_target = valid_targets[0]
-                logger.debug(f"'{self.actor.name}' (BasicRanged) wählt schwächstes Ziel: '{chosen_target.name}'.")
+                chosen_target = min(valid_targets, key=lambda t: (t.current_hp / t.max_hp) if t.max_hp > 0 else float('inf')) # Nur das Minimum wird gebraucht, kein Sortieren
+                logger.debug("'%s' (BasicRanged) wählt schwächstes Ziel: '%s'.", self.actor.name, chosen_target.name)
             else:
                 chosen_target = random.choice(valid_targets)
-                logger.debug(f"'{self.actor.name}' (BasicRanged) wählt zufälliges Ziel: '{chosen_target.name}'.")
+                logger.debug("'%s' (BasicRanged) wählt zufälliges Ziel: '%s'.", self.actor.name, chosen_target.name)
         return chosen_target
 
     def choose_skill(self, available_skills: List[str], target: Optional['CharacterInstance']) -> Optional[str]:
@@ -88,36 +91,32 @@ class BasicRangedStrategy:
 
         if skills_with_debuffs and random.random() < 0.60:
             chosen_skill_id = random.choice(skills_with_debuffs)
-            logger.debug(f"'{self.actor.name}' (BasicRanged) wählt Skill mit Debuff: '{chosen_skill_id}'.")
+            logger.debug("'%s' (BasicRanged) wählt Skill mit Debuff: '%s'.", self.actor.name, chosen_skill_id)
         else:
-            offensive_skills = []
-            for s_id in usable_skills:
-                skill = self.skill_definitions.get(s_id)
-                if skill and skill.direct_effects and \
-                   (skill.direct_effects.base_damage is not None or \
-                    (skill.direct_effects.base_damage is None and True)): # True, wenn Waffenschaden als offensiv gilt
-                    offensive_skills.append(s_id)
+            # Offensiv ist jeder Skill mit direkten Effekten (Waffenschaden ohne base_damage zählt mit)
+            skill_definitions = self.skill_definitions
+            offensive_skills = [s_id for s_id in usable_skills
+                                if s_id in skill_definitions and skill_definitions[s_id].direct_effects]
             
             if offensive_skills:
-                offensive_skills.sort(key=lambda s_id: self._get_skill_potential_damage(s_id), reverse=True)
-                chosen_skill_id = offensive_skills[0]
-                logger.debug(f"'{self.actor.name}' (BasicRanged) wählt stärksten offensiven Skill: '{chosen_skill_id}'.")
+                chosen_skill_id = max(offensive_skills, key=self._get_skill_potential_damage) # Erstes Maximum wie zuvor nach stabiler Sortierung
+                logger.debug("'%s' (BasicRanged) wählt stärksten offensiven Skill: '%s'.", self.actor.name, chosen_skill_id)
             elif usable_skills: 
                 chosen_skill_id = random.choice(usable_skills)
-                logger.debug(f"'{self.actor.name}' (BasicRanged) wählt zufälligen verfügbaren Skill: '{chosen_skill_id}'.")
+                logger.debug("'%s' (BasicRanged) wählt zufälligen verfügbaren Skill: '%s'.", self.actor.name, chosen_skill_id)
         return chosen_skill_id
 
     def decide_action(self, potential_targets: List['CharacterInstance']) -> Optional[Tuple[str, 'CharacterInstance']]:
         if not self.actor or self.actor.is_defeated or not self.actor.can_act: return None
         target = self.choose_target(potential_targets)
         if not target:
-            logger.debug(f"'{self.actor.name}' (BasicRanged) findet kein Ziel.")
+            logger.debug("'%s' (BasicRanged) findet kein Ziel.", self.actor.name)
             return None
         skill_id = self.choose_skill(self.actor.skills, target)
         if not skill_id:
-            logger.debug(f"'{self.actor.name}' (BasicRanged) konnte keinen Skill auswählen.")
+            logger.debug("'%s' (BasicRanged) konnte keinen Skill auswählen.", self.actor.name)
             return None
-        logger.debug(f"'{self.actor.name}' (BasicRanged) entscheidet sich für Skill '{skill_id}' auf Ziel '{target.name}'.") # KORREKTUR: DEBUG statt INFO
+        logger.debug("'%s' (BasicRanged) entscheidet sich für Skill '%s' auf Ziel '%s'.", self.actor.name, skill_id, target.name) # KORREKTUR: DEBUG statt INFO
         return skill_id, target
 
 # ... (if __name__ == '__main__' Block bleibt gleich)
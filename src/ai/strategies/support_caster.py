@@ -10,6 +10,12 @@ from src.definitions.opponent import OpponentTemplate # Import für Typ-Check
 
 logger = logging.getLogger(__name__)
 
+# Einmal auf Modulebene statt bei jedem Aufruf der Schadensabschätzung importieren
+try:
+    from src.config.config import CONFIG
+except ImportError:
+    CONFIG = None
+
 class SupportCasterStrategy:
     def __init__(self, actor: 'CharacterInstance', 
                  all_entities_in_combat: List['CharacterInstance'], 
@@ -20,25 +26,25 @@ class SupportCasterStrategy:
         self.skill_definitions = skill_definitions
         # self.character_definitions = character_definitions # Aktuell nicht direkt genutzt
 
-    def _get_allies(self) -> List['CharacterInstance']:
+    def _get_allies_and_opponents(self) -> Tuple[List['CharacterInstance'], List['CharacterInstance']]:
+        """Teilt alle lebenden Kampfteilnehmer in einem Durchlauf in Verbündete und Gegner des Akteurs auf."""
         actor_is_opponent_type = isinstance(self.actor.base_template, OpponentTemplate)
-        allies = []
+        allies: List['CharacterInstance'] = []
+        opponents: List['CharacterInstance'] = []
         for entity in self.all_entities_in_combat:
             if entity.is_defeated: continue
             entity_is_opponent_type = isinstance(entity.base_template, OpponentTemplate)
             if actor_is_opponent_type == entity_is_opponent_type:
                 allies.append(entity)
-        return allies
+            else:
+                opponents.append(entity)
+        return allies, opponents
+
+    def _get_allies(self) -> List['CharacterInstance']:
+        return self._get_allies_and_opponents()[0]
 
     def _get_opponents(self) -> List['CharacterInstance']:
-        actor_is_opponent_type = isinstance(self.actor.base_template, OpponentTemplate)
-        opponents = []
-        for entity in self.all_entities_in_combat:
-            if entity.is_defeated: continue
-            entity_is_opponent_type = isinstance(entity.base_template, OpponentTemplate)
-            if actor_is_opponent_type != entity_is_opponent_type:
-                opponents.append(entity)
-        return opponents
+        return self._get_allies_and_opponents()[1]
 
     def _is_skill_type(self, skill_id: str, skill_type: str) -> bool:
         skill = self.skill_definitions.get(skill_id)
@@ -55,16 +61,12 @@ class SupportCasterStrategy:
                 return True 
             return False
         if skill_type == "OFFENSIVE_ENEMY":
-            is_offensive = skill.direct_effects and \
-                           (skill.direct_effects.base_damage is not None or \
-                            (skill.direct_effects.base_damage is None and True)) # True, wenn Waffenschaden als offensiv gilt
-            return skill.target_type.startswith("ENEMY_") and is_offensive
+            # Offensiv ist jeder Skill mit direkten Effekten (Waffenschaden ohne base_damage zählt mit)
+            return skill.target_type.startswith("ENEMY_") and bool(skill.direct_effects)
         return False
 
     def _get_skill_potential_damage(self, skill_id: str) -> int: # Gleich wie in anderen Strategien
         skill = self.skill_definitions.get(skill_id)
-        try: from src.config.config import CONFIG
-        except ImportError: CONFIG = None
         base_damage_val = 0
         is_offensive = False
         if skill and skill.direct_effects:
@@ -83,12 +85,11 @@ class SupportCasterStrategy:
 
     def decide_action(self, potential_targets_unused: List['CharacterInstance']) -> Optional[Tuple[str, 'CharacterInstance']]:
         if not self.actor or self.actor.is_defeated or not self.actor.can_act: return None
-        allies = self._get_allies()
-        opponents = self._get_opponents()
+        allies, opponents = self._get_allies_and_opponents() # Einmal pro Zug statt zwei Durchläufe
         
-        usable_skills = [s_id for s_id in self.actor.skills if self.actor.can_afford_skill(self.skill_definitions.get(s_id))]
+        usable_skills = self.actor.get_usable_skill_ids(self.skill_definitions)
         if not usable_skills: 
-            logger.debug(f"'{self.actor.name}' (SupportCaster) hat keine nutzbaren Skills.")
+            logger.debug("'%s' (SupportCaster) hat keine nutzbaren Skills.", self.actor.name)
             return None
 
         # 1. Heilung
@@ -99,7 +100,7 @@ class SupportCasterStrategy:
             if injured_allies:
                 target_for_heal = injured_allies[0]
                 chosen_skill_id = healing_skills[0] 
-                logger.debug(f"'{self.actor.name}' (SupportCaster) entscheidet HEILUNG: '{chosen_skill_id}' auf '{target_for_heal.name}'.") # KORREKTUR: DEBUG
+                logger.debug("'%s' (SupportCaster) entscheidet HEILUNG: '%s' auf '%s'.", self.actor.name, chosen_skill_id, target_for_heal.name) # KORREKTUR: DEBUG
                 return chosen_skill_id, target_for_heal
 
         # 2. Buffs
@@ -107,7 +108,7 @@ class SupportCasterStrategy:
         if buff_skills and allies:
             target_for_buff = random.choice(allies) 
             chosen_skill_id = random.choice(buff_skills)
-            logger.debug(f"'{self.actor.name}' (SupportCaster) entscheidet BUFF: '{chosen_skill_id}' auf '{target_for_buff.name}'.") # KORREKTUR: DEBUG
+            logger.debug("'%s' (SupportCaster) entscheidet BUFF: '%s' auf '%s'.", self.actor.name, chosen_skill_id, target_for_buff.name) # KORREKTUR: DEBUG
             return chosen_skill_id, target_for_buff
         
         # 3. Debuffs
@@ -115,19 +116,18 @@ class SupportCasterStrategy:
         if debuff_skills and opponents:
             target_for_debuff = random.choice(opponents)
             chosen_skill_id = random.choice(debuff_skills)
-            logger.debug(f"'{self.actor.name}' (SupportCaster) entscheidet DEBUFF: '{chosen_skill_id}' auf '{target_for_debuff.name}'.") # KORREKTUR: DEBUG
+            logger.debug("'%s' (SupportCaster) entscheidet DEBUFF: '%s' auf '%s'.", self.actor.name, chosen_skill_id, target_for_debuff.name) # KORREKTUR: DEBUG
             return chosen_skill_id, target_for_debuff
 
         # 4. Offensive Angriffe
         offensive_skills = [s_id for s_id in usable_skills if self._is_skill_type(s_id, "OFFENSIVE_ENEMY")]
         if offensive_skills and opponents:
             target_for_attack = random.choice(opponents)
-            offensive_skills.sort(key=lambda s_id: self._get_skill_potential_damage(s_id), reverse=True)
-            chosen_skill_id = offensive_skills[0]
-            logger.debug(f"'{self.actor.name}' (SupportCaster) entscheidet ANGRIFF: '{chosen_skill_id}' auf '{target_for_attack.name}'.") # KORREKTUR: DEBUG
+            chosen_skill_id = max(offensive_skills, key=self._get_skill_potential_damage) # Erstes Maximum wie zuvor nach stabiler Sortierung
+            logger.debug("'%s' (SupportCaster) entscheidet ANGRIFF: '%s' auf '%s'.", self.actor.name, chosen_skill_id, target_for_attack.name) # KORREKTUR: DEBUG
             return chosen_skill_id, target_for_attack
 
-        logger.debug(f"'{self.actor.name}' (SupportCaster) konnte keine passende Aktion finden.")
+        logger.debug("'%s' (SupportCaster) konnte keine passende Aktion finden.", self.actor.name)
         return None
 
 # ... (if __name__ == '__main__' Block bleibt gleich)
@@ -3,8 +3,11 @@
 Modul zum Laden von Spieldefinitionen (Charaktere, Skills, Gegner etc.)
 aus JSON5-Dateien.
 """
+import json
 import json5 # Wichtig: Benötigt die json5-Bibliothek
 import os
+import pickle
+import importlib
 from typing import Dict, List, Any, Optional # Optional hinzugefügt
 
 # Importiere die Template-Klassen aus den anderen Definitionsmodulen
@@ -18,21 +21,95 @@ CHARACTERS_FILE = os.path.join(_JSON_DATA_PATH, "characters.json5")
 SKILLS_FILE = os.path.join(_JSON_DATA_PATH, "skills.json5")
 OPPONENTS_FILE = os.path.join(_JSON_DATA_PATH, "opponents.json5") # Bereits vorhanden
 # ITEMS_FILE = os.path.join(_JSON_DATA_PATH, "items.json5") # Platzhalter
+# Von tools/build_defs.py --python-modules erzeugte Module mit den Daten als Python-Literal
+GENERATED_DIR = os.path.join(os.path.dirname(__file__), 'generated')
+
+# Optional: orjson als schneller Parser für Dateien, die gültiges Standard-JSON sind
+try:
+    import orjson
+    _fast_json_loads = orjson.loads
+    _FastJSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _fast_json_loads = json.loads
+    _FastJSONDecodeError = json.JSONDecodeError
 
 # Globale Variablen zum Speichern der geladenen Daten (als Cache)
 _character_templates: Optional[Dict[str, CharacterTemplate]] = None
 _skill_templates: Optional[Dict[str, SkillTemplate]] = None
 _opponent_templates: Optional[Dict[str, OpponentTemplate]] = None # Aktiviert
 
+def get_snapshot_path(file_path: str) -> str:
+    """Pfad des binären Snapshots (Pickle) zu einer JSON5-Definitionsdatei, z.B. characters.json5 -> characters.pkl."""
+    return os.path.splitext(file_path)[0] + ".pkl"
+
+def get_literal_module_path(file_path: str) -> str:
+    """Pfad des generierten Python-Moduls zu einer JSON5-Definitionsdatei, z.B. characters.json5 -> generated/characters_data.py."""
+    return os.path.join(GENERATED_DIR, _literal_module_name(file_path) + ".py")
+
+def _literal_module_name(file_path: str) -> str:
+    return os.path.splitext(os.path.basename(file_path))[0] + "_data"
+
+def _load_literal_module(file_path: str) -> Any:
+    """
+    Lädt die Daten aus dem generierten Python-Modul (DATA-Literal) per import.
+    Gibt None zurück, wenn kein Modul existiert oder es älter als die JSON5-Datei ist.
+    """
+    module_path = get_literal_module_path(file_path)
+    if not os.path.isfile(module_path):
+        return None
+    try:
+        if os.path.getmtime(module_path) < os.path.getmtime(file_path):
+            return None # Veraltet: JSON5-Datei wurde danach geändert
+        module = importlib.import_module(f".generated.{_literal_module_name(file_path)}", __package__)
+        return module.DATA
+    except Exception as e:
+        print(f"WARNUNG: Generiertes Modul {module_path} nicht ladbar, verwende Snapshot/JSON5: {e}")
+        return None
+
+# Snapshot-Pfade der bekannten Definitionsdateien, einmalig berechnet
+_SNAPSHOT_PATHS: Dict[str, str] = {path: get_snapshot_path(path) for path in (CHARACTERS_FILE, SKILLS_FILE, OPPONENTS_FILE)}
+
+def _load_snapshot(file_path: str) -> Any:
+    """
+    Lädt den mit tools/build_defs.py erzeugten Pickle-Snapshot einer JSON5-Datei.
+    Gibt None zurück, wenn kein Snapshot existiert, er älter als die JSON5-Datei ist oder nicht lesbar ist.
+    """
+    snapshot_path = _SNAPSHOT_PATHS.get(file_path) or get_snapshot_path(file_path)
+    if not os.path.isfile(snapshot_path):
+        return None # Normalfall ohne build_defs-Lauf: einfache Existenzprüfung statt Exception
+    try:
+        if os.path.getmtime(snapshot_path) < os.path.getmtime(file_path):
+            return None # Veralteter Snapshot: JSON5-Datei wurde danach geändert
+        with open(snapshot_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        print(f"WARNUNG: Snapshot {snapshot_path} nicht lesbar, verwende JSON5: {e}")
+        return None
+
+def parse_definition_bytes(raw: bytes) -> Any:
+    """
+    Parst den Inhalt einer Definitionsdatei. Zuerst wird der schnelle Standard-JSON-Parser (orjson bzw. json)
+    versucht; nur wenn die Datei JSON5-Syntax nutzt (Kommentare, Trailing Commas etc.), wird json5 verwendet.
+    """
+    try:
+        return _fast_json_loads(raw)
+    except _FastJSONDecodeError:
+        return json5.loads(raw.decode('utf-8'))
+
 def _load_json5_file(file_path: str) -> Any:
     """
     Hilfsfunktion zum Laden und Parsen einer JSON5-Datei.
-    Gibt den geparsten Inhalt zurück.
+    Bevorzugt ein aktuelles generiertes Python-Modul, danach einen aktuellen Pickle-Snapshot der Datei, falls vorhanden.
+    Gibt den geparsten Inhalt zurück; das Ergebnis merken sich die load_*_templates-Funktionen.
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json5.load(f)
+    data = _load_literal_module(file_path)
+    if data is None:
+        data = _load_snapshot(file_path)
+    if data is not None:
         return data
+    try:
+        with open(file_path, 'rb') as f:
+            return parse_definition_bytes(f.read())
     except FileNotFoundError:
         print(f"FEHLER: Datei nicht gefunden: {file_path}")
         raise
@@ -4,7 +4,28 @@ Definiert die Datenstruktur für Skill-Templates, die aus JSON5-Dateien geladen
 basierend auf der überarbeiteten Struktur (Objekt mit Skill-IDs als Schlüssel).
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+# Zuordnung Ressourcentyp -> Attributname der aktuellen Ressource in CharacterInstance
+_CURRENT_RESOURCE_ATTRS: Dict[str, str] = {
+    "MANA": "current_mana",
+    "STAMINA": "current_stamina",
+    "ENERGY": "current_energy",
+}
+# Cache: roher Ressourcentyp -> (normalisierter Typ, Attributname oder None)
+_RESOURCE_KEY_CACHE: Dict[Optional[str], Tuple[str, Optional[str]]] = {}
+
+def resolve_resource_key(resource_type: Optional[str]) -> Tuple[str, Optional[str]]:
+    """
+    Normalisiert einen Ressourcentyp einmalig und merkt sich das Ergebnis.
+    Gibt (TYP_IN_GROSSBUCHSTABEN, 'current_<typ>' oder None) zurück; None als Typ wird zu "NONE".
+    """
+    key = _RESOURCE_KEY_CACHE.get(resource_type)
+    if key is None:
+        resource_type_upper = resource_type.upper() if resource_type is not None else "NONE"
+        key = (resource_type_upper, _CURRENT_RESOURCE_ATTRS.get(resource_type_upper))
+        _RESOURCE_KEY_CACHE[resource_type] = key
+    return key
 
 class SkillEffectData:
     """
@@ -69,6 +90,8 @@ class SkillCostData:
     def __init__(self, value: int, type: str): # z.B. type = "MANA", "STAMINA", "ENERGY", "NONE"
         self.value = value
         self.type = type
+        # Beim Laden vorberechnet, damit Kostenprüfungen im Kampf keine Strings bauen müssen
+        self.type_upper, self.current_attr = resolve_resource_key(type)
 
     def __repr__(self) -> str:
         return f"SkillCostData(val={self.value}, type='{self.type}')"
@@ -135,7 +135,7 @@ class ActionManager:
         if not target_instance:
             # Dies sollte idealerweise von der Action Mask verhindert werden.
             # Wenn es hier passiert, war die Maske nicht präzise genug oder der Agent hat eine ungültige Aktion gewählt.
-            logger.debug(f"ActionManager: Für Aktion {action_id} (Skill '{skill_id_to_use}', Ziel-Opt {target_option_idx}) kein gültiges lebendes Ziel gefunden im aktuellen Zustand.")
+            logger.debug("ActionManager: Für Aktion %s (Skill '%s', Ziel-Opt %s) kein gültiges lebendes Ziel gefunden im aktuellen Zustand.", action_id, skill_id_to_use, target_option_idx)
             return None
             
         return skill_id_to_use, target_instance
@@ -39,7 +39,10 @@ class RewardManager:
 
     def record_hp_at_turn_start(self, participants: List[CharacterInstance]):
         """Speichert die HP aller Teilnehmer zu Beginn eines Zuges."""
-        self.hp_at_turn_start = {p.instance_id: p.current_hp for p in participants if p}
+        hp_at_turn_start = self.hp_at_turn_start # Dict wiederverwenden statt pro Zug neu anzulegen
+        hp_at_turn_start.clear()
+        for p in participants:
+            if p: hp_at_turn_start[p.instance_id] = p.current_hp
 
     def calculate_reward_for_hero_action(self, 
                                          state_manager: EnvStateManager,
@@ -59,12 +62,12 @@ class RewardManager:
 
         if not action_was_valid_by_mask:
             reward += self.config.get("invalid_action_penalty", -1.0)
-            logger.debug(f"RewardManager: Strafe für ungültige maskierte Aktion: {self.config.get('invalid_action_penalty', -1.0)}")
+            logger.debug("RewardManager: Strafe für ungültige maskierte Aktion: %s", self.config.get('invalid_action_penalty', -1.0))
             return reward # Keine weiteren Rewards/Penalties für diese Aktion
 
         if not action_was_executable: # z.B. kein Ziel gefunden, obwohl Skill ein Ziel brauchte
             reward += self.config.get("no_target_penalty", -0.5)
-            logger.debug(f"RewardManager: Strafe für nicht ausführbare Aktion (z.B. kein Ziel): {self.config.get('no_target_penalty', -0.5)}")
+            logger.debug("RewardManager: Strafe für nicht ausführbare Aktion (z.B. kein Ziel): %s", self.config.get('no_target_penalty', -0.5))
             return reward
 
         # Belohnung für Schaden an Gegnern
@@ -74,11 +77,11 @@ class RewardManager:
                 if damage_done > 0:
                     damage_reward = damage_done * self.config.get("damage_to_opponent_mult", 0.2)
                     reward += damage_reward
-                    logger.debug(f"RewardManager: +{damage_reward:.2f} für {damage_done} Schaden an {opp.name}")
+                    logger.debug("RewardManager: +%.2f für %s Schaden an %s", damage_reward, damage_done, opp.name)
                 if opp.is_defeated and self.hp_at_turn_start.get(opp.instance_id, 0) > 0 : # War vorher lebend
                     defeated_bonus = self.config.get("opponent_defeated_bonus", 10.0)
                     reward += defeated_bonus
-                    logger.debug(f"RewardManager: +{defeated_bonus:.2f} für Besiegen von {opp.name}")
+                    logger.debug("RewardManager: +%.2f für Besiegen von %s", defeated_bonus, opp.name)
 
 
         # Belohnung für Heilung des Helden / Strafe für Selbstschaden
@@ -87,7 +90,7 @@ class RewardManager:
             if hp_change_hero > 0: # Heilung
                 heal_reward = hp_change_hero * self.config.get("heal_hero_mult", 0.1)
                 reward += heal_reward
-                logger.debug(f"RewardManager: +{heal_reward:.2f} für {hp_change_hero} Selbstheilung")
+                logger.debug("RewardManager: +%.2f für %s Selbstheilung", heal_reward, hp_change_hero)
             elif hp_change_hero < 0: # Selbstschaden
                 # Selbstschaden wird bereits als "Schaden am Helden" behandelt, wenn Gegner agieren
                 # Hier könnte man eine spezifische Strafe für Skills geben, die den Helden verletzen.
@@ -138,13 +141,13 @@ class RewardManager:
         if terminated:
             if hero_won:
                 final_reward += self.config.get("all_opponents_defeated_bonus", 50.0)
-                logger.debug(f"RewardManager: +{self.config.get('all_opponents_defeated_bonus', 50.0):.2f} für Sieg (alle Gegner besiegt).")
+                logger.debug("RewardManager: +%.2f für Sieg (alle Gegner besiegt).", self.config.get('all_opponents_defeated_bonus', 50.0))
             elif hero and hero.is_defeated: # Sicherstellen, dass Held existiert
                 final_reward += self.config.get("hero_defeated_penalty", -50.0)
-                logger.debug(f"RewardManager: {self.config.get('hero_defeated_penalty', -50.0):.2f} für Niederlage (Held besiegt).")
+                logger.debug("RewardManager: %.2f für Niederlage (Held besiegt).", self.config.get('hero_defeated_penalty', -50.0))
         elif max_steps_reached: # Truncated
             final_reward += self.config.get("max_steps_reached_penalty", -10.0)
-            logger.debug(f"RewardManager: {self.config.get('max_steps_reached_penalty', -10.0):.2f} für Erreichen des Zeitlimits.")
+            logger.debug("RewardManager: %.2f für Erreichen des Zeitlimits.", self.config.get('max_steps_reached_penalty', -10.0))
             
         return final_reward
 
@@ -7,6 +7,7 @@ import gymnasium as gym
 from gymnasium import spaces 
 import numpy as np
 import logging
+import os
 import random 
 import time 
 from typing import Optional, List, Dict, Any, Tuple, SupportsFloat 
@@ -24,6 +25,9 @@ from src.definitions.skill import SkillTemplate
 
 logger = logging.getLogger(__name__)
 
+# Pause nach jedem gerenderten Schritt im "human"-Modus (nur zur Lesbarkeit); RPG_FAST_UI=1 schaltet sie ab
+HUMAN_RENDER_STEP_DELAY = 0.0 if os.environ.get("RPG_FAST_UI") == "1" else 0.05
+
 # Globale Caches für Definitionen, die einmal geladen und an Manager übergeben werden
 _CHARACTER_TEMPLATES_ENV: Optional[Dict[str, CharacterTemplate]] = None
 _OPPONENT_TEMPLATES_ENV: Optional[Dict[str, OpponentTemplate]] = None
@@ -175,7 +179,7 @@ class RPGEnv(gym.Env[np.ndarray, int]):
         action_executed_successfully = False # Ob die Aktion vom StateManager ausgeführt wurde
 
         if hero.is_defeated or not hero.can_act:
-            logger.debug(f"Held '{hero.name}' kann in step() nicht handeln.")
+            logger.debug("Held '%s' kann in step() nicht handeln.", hero.name)
             self.state_manager.last_action_successful = False
         elif not is_action_valid_by_mask:
             logger.warning(f"RL Agent (Held '{hero.name}') wählte ungültige/maskierte Aktion: {action}. Maske: {action_mask}")
@@ -210,7 +214,7 @@ class RPGEnv(gym.Env[np.ndarray, int]):
                 if damage_taken_from_npcs > 0:
                     npc_damage_penalty = damage_taken_from_npcs * self.reward_manager.config.get("damage_to_hero_penalty_mult", -0.3)
                     current_reward += npc_damage_penalty
-                    logger.debug(f"RewardManager: Strafe {npc_damage_penalty:.2f} für {damage_taken_from_npcs} Schaden am Helden durch NPCs.")
+                    logger.debug("RewardManager: Strafe %.2f für %s Schaden am Helden durch NPCs.", npc_damage_penalty, damage_taken_from_npcs)
 
             term_after_npc, _, _ = self.state_manager.check_combat_end_conditions()
             if term_after_npc:
@@ -227,7 +231,7 @@ class RPGEnv(gym.Env[np.ndarray, int]):
         
         if self.render_mode == "human":
             self.render()
-            if not terminated and not truncated: time.sleep(0.05)
+            if not terminated and not truncated and HUMAN_RENDER_STEP_DELAY: time.sleep(HUMAN_RENDER_STEP_DELAY)
 
         return observation, current_reward, terminated, truncated, info
 
@@ -33,6 +33,16 @@ class EnvStateManager:
 
         self.current_episode_step: int = 0
         self.last_action_successful: bool = True 
+        # Template-ID -> einmal erstellte Prototyp-Instanz; bei jedem Reset wird davon geklont statt neu berechnet
+        self._instance_prototypes: Dict[str, CharacterInstance] = {}
+
+    def _spawn_instance(self, template: CharacterTemplate | OpponentTemplate, name_override: str) -> CharacterInstance:
+        """Erstellt eine frische Instanz eines Templates als Kopie eines (gecachten) Prototyps."""
+        prototype = self._instance_prototypes.get(template.id)
+        if prototype is None:
+            prototype = CharacterInstance(base_template=template)
+            self._instance_prototypes[template.id] = prototype
+        return prototype.clone(name_override=name_override)
 
     def _create_dynamic_opponent_team(self, opponent_config: Dict[str, Any]) -> List[Optional[CharacterInstance]]:
         """Erstellt ein Gegnerteam basierend auf der Konfiguration (num, pool). Füllt self.opponents."""
@@ -44,12 +54,12 @@ class EnvStateManager:
         eligible_templates: List[OpponentTemplate] = []
 
         if specific_ids and isinstance(specific_ids, list):
-            logger.debug(f"StateManager: Erstelle Gegnerteam mit spezifischen IDs: {specific_ids}")
+            logger.debug("StateManager: Erstelle Gegnerteam mit spezifischen IDs: %s", specific_ids)
             for i, opp_id in enumerate(specific_ids):
                 if i >= self.max_supported_opponents: break # Nicht mehr als max Slots füllen
                 template = self.opponent_templates.get(opp_id)
                 if template:
-                    new_opponent_list[i] = CharacterInstance(base_template=template, name_override=f"{template.name} #{i+1}")
+                    new_opponent_list[i] = self._spawn_instance(template, f"{template.name} #{i+1}")
                 else:
                     logger.warning(f"StateManager: Spezifisches Gegner-Template '{opp_id}' nicht gefunden.")
             return new_opponent_list # Rückgabe hier, da spezifische IDs Vorrang haben
@@ -68,7 +78,7 @@ class EnvStateManager:
         for opp_template in self.opponent_templates.values():
             if level_pool_str == "all":
                 eligible_templates.append(opp_template)
-            elif hasattr(opp_template, 'level') and min_lvl <= opp_template.level <= max_lvl:
+            elif min_lvl <= opp_template.level <= max_lvl: # OpponentTemplate hat immer ein level
                 eligible_templates.append(opp_template)
         
         if not eligible_templates:
@@ -84,7 +94,7 @@ class EnvStateManager:
 
         for i in range(num_to_actually_create):
             chosen_template = random.choice(eligible_templates) # TODO: Vermeide Duplikate, wenn gewünscht und len(eligible) > num
-            new_opponent_list[i] = CharacterInstance(base_template=chosen_template, name_override=f"{chosen_template.name} #{i+1}")
+            new_opponent_list[i] = self._spawn_instance(chosen_template, f"{chosen_template.name} #{i+1}")
             
         return new_opponent_list
 
@@ -97,10 +107,10 @@ class EnvStateManager:
         if not hero_template:
             logger.error(f"StateManager: Helden-Template '{hero_id}' nicht gefunden.")
             return False
-        self.hero = CharacterInstance(base_template=hero_template, name_override=hero_template.name)
+        self.hero = self._spawn_instance(hero_template, hero_template.name)
 
         # Gegner dynamisch erstellen
-        self.opponents = self._create_dynamic_opponent_team(opponent_setup_config)
+        self.opponents[:] = self._create_dynamic_opponent_team(opponent_setup_config) # Slot-Liste wiederverwenden
         
         self._update_all_participants_list()
 
@@ -131,7 +141,7 @@ class EnvStateManager:
         self.last_action_successful = False 
         if not self.hero or self.hero.is_defeated or not self.hero.can_act:
             msg = f"Held {self.hero.name if self.hero else 'N/A'} kann nicht handeln."
-            logger.debug(f"StateManager: {msg}")
+            logger.debug("StateManager: %s", msg)
             return False, msg
         
         if not target_instance:
@@ -146,7 +156,7 @@ class EnvStateManager:
         self.last_action_successful = True # Annahme: Wenn CombatHandler keine Exception wirft, ist die Ausführung "gestartet"
         
         msg = f"Held {self.hero.name} führte Skill {skill_id} auf {target_instance.name} aus (via StateManager)."
-        logger.debug(f"StateManager: {msg}")
+        logger.debug("StateManager: %s", msg)
         return True, msg
 
 
@@ -159,7 +169,8 @@ class EnvStateManager:
             if not opponent or opponent.is_defeated:
                 continue
 
-            process_beginning_of_turn_effects(opponent) 
+            if opponent.has_active_effects: # Ohne Effekte ist der Zugbeginn ein No-op
+                process_beginning_of_turn_effects(opponent) 
             if opponent.is_defeated or not opponent.can_act:
                 continue
 
@@ -173,10 +184,10 @@ class EnvStateManager:
                     decision = ai_strategy.decide_action(targets_for_npc) 
                     if decision:
                         opp_skill_id, opp_target_instance = decision 
-                        logger.debug(f"StateManager NPC '{opponent.name}' Aktion: Skill '{opp_skill_id}' auf '{opp_target_instance.name}'.")
+                        logger.debug("StateManager NPC '%s' Aktion: Skill '%s' auf '%s'.", opponent.name, opp_skill_id, opp_target_instance.name)
                         self.combat_handler.execute_skill_action(opponent, opp_skill_id, [opp_target_instance])
                 else: # Keine Strategie für NPC
-                    logger.debug(f"StateManager NPC '{opponent.name}' hat keine KI-Strategie oder konnte keine Aktion wählen.")
+                    logger.debug("StateManager NPC '%s' hat keine KI-Strategie oder konnte keine Aktion wählen.", opponent.name)
             
             if self.hero.is_defeated: 
                 break 
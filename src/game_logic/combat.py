@@ -51,7 +51,7 @@ class CombatHandler:
             return False, f"Skill '{skill_id}' unbekannt.", None
         
         if not actor.can_afford_skill(skill): # Verwendet die neue Methode in CharacterInstance
-             return False, f"Nicht genügend {skill.cost.type} ({actor.name} hat {getattr(actor, 'current_' + skill.cost.type.lower(), 0)}, benötigt {skill.cost.value}).", skill
+             return False, f"Nicht genügend {skill.cost.type} ({actor.name} hat {getattr(actor, skill.cost.current_attr, 0) if skill.cost.current_attr else 0}, benötigt {skill.cost.value}).", skill
         
         if skill.target_type not in ["SELF", "NONE"] and not target: # NONE für Skills ohne Ziel
             # Spezifischere Target-Typen wie ALLY_SINGLE, ENEMY_SINGLE etc. erfordern ein Ziel.
@@ -63,21 +63,21 @@ class CombatHandler:
 
     def execute_skill_action(self, actor: CharacterInstance, skill_id: str, targets: List[CharacterInstance]):
         if not targets or not targets[0]: 
-            logger.warning(f"Keine (gültigen) Primärziele für Skill '{skill_id}' von '{actor.name}' angegeben. Aktion abgebrochen.")
+            logger.warning("Keine (gültigen) Primärziele für Skill '%s' von '%s' angegeben. Aktion abgebrochen.", skill_id, actor.name)
             return
 
         primary_target = targets[0] 
         can_act_check, reason_check, skill = self._check_action_usability(actor, skill_id, primary_target)
         
         if not can_act_check or not skill:
-            logger.warning(f"Aktion '{skill_id}' von '{actor.name}' auf '{primary_target.name if primary_target else 'N/A'}' fehlgeschlagen (Vorabprüfung): {reason_check}")
+            logger.warning("Aktion '%s' von '%s' auf '%s' fehlgeschlagen (Vorabprüfung): %s", skill_id, actor.name, primary_target.name if primary_target else 'N/A', reason_check)
             return
 
         if not actor.consume_resource(skill.cost.value, skill.cost.type):
-            logger.warning(f"Aktion '{skill_id}' von '{actor.name}' fehlgeschlagen: Nicht genügend {skill.cost.type} (beim Versuch zu verbrauchen).")
+            logger.warning("Aktion '%s' von '%s' fehlgeschlagen: Nicht genügend %s (beim Versuch zu verbrauchen).", skill_id, actor.name, skill.cost.type)
             return
 
-        logger.info(f"'{actor.name}' führt Skill '{skill.name}' (ID: {skill_id}) aus.")
+        logger.info("'%s' führt Skill '%s' (ID: %s) aus.", actor.name, skill.name, skill_id)
 
         affected_targets: List[CharacterInstance] = []
         if skill.target_type == "SELF":
@@ -100,12 +100,12 @@ class CombatHandler:
                 affected_targets = [primary_target]
         
         if not affected_targets:
-            logger.info(f"Keine gültigen Ziele für '{skill.name}' nach Filterung gefunden.")
+            logger.info("Keine gültigen Ziele für '%s' nach Filterung gefunden.", skill.name)
             actor.restore_resource(skill.cost.value, skill.cost.type) # Ressourcen zurückgeben
             return
 
         for current_target_char in affected_targets:
-            logger.debug(f"Verarbeite Skill '{skill.name}' von '{actor.name}' auf Ziel '{current_target_char.name}'.")
+            logger.debug("Verarbeite Skill '%s' von '%s' auf Ziel '%s'.", skill.name, actor.name, current_target_char.name)
 
             # KORRIGIERTE Logik für is_offensive_skill und is_offensive_on_enemy
             is_offensive_skill = skill.direct_effects and \
@@ -121,9 +121,9 @@ class CombatHandler:
                 hit_roll_successful = roll <= hit_chance
                 
                 if hit_roll_successful:
-                    logger.info(f"'{actor.name}' trifft '{current_target_char.name}' mit '{skill.name}' (Wurf: {roll} <= Chance: {hit_chance}%).")
+                    logger.info("'%s' trifft '%s' mit '%s' (Wurf: %s <= Chance: %s%%).", actor.name, current_target_char.name, skill.name, roll, hit_chance)
                 else:
-                    logger.info(f"'{actor.name}' verfehlt '{current_target_char.name}' mit '{skill.name}' (Wurf: {roll} > Chance: {hit_chance}%).")
+                    logger.info("'%s' verfehlt '%s' mit '%s' (Wurf: %s > Chance: %s%%).", actor.name, current_target_char.name, skill.name, roll, hit_chance)
                     cli_output.display_miss(actor.name, current_target_char.name, skill.name)
                     continue 
 
@@ -150,8 +150,8 @@ class CombatHandler:
                         crit_chance_roll = random.random() 
                         if crit_chance_roll < effect_data.bonus_crit_chance:
                             is_critical_hit = True
-                            logger.info(f"KRITISCHER TREFFER von '{actor.name}' auf '{current_target_char.name}'!")
-                            cli_output.print_message(f"KRITISCHER TREFFER von {actor.name}!", cli_output.Colors.LIGHT_YELLOW + cli_output.Colors.BOLD)
+                            logger.info("KRITISCHER TREFFER von '%s' auf '%s'!", actor.name, current_target_char.name)
+                            cli_output.print_message(f"KRITISCHER TREFFER von {actor.name}!", cli_output.Colors.LIGHT_YELLOW_BOLD)
 
                     # Schadenslogik (nur wenn es ein offensiver Skill ist)
                     if is_offensive_skill: 
@@ -194,7 +194,7 @@ class CombatHandler:
                 if skill.applied_status_effects: 
                     for applied_effect_obj in skill.applied_status_effects: 
                         if random.random() > applied_effect_obj.application_chance:
-                            logger.debug(f"Anwendung von Effekt '{applied_effect_obj.effect_id}' auf '{current_target_char.name}' fehlgeschlagen (Chance: {applied_effect_obj.application_chance:.0%}).")
+                            logger.debug("Anwendung von Effekt '%s' auf '%s' fehlgeschlagen (Chance: %.0f%%).", applied_effect_obj.effect_id, current_target_char.name, applied_effect_obj.application_chance * 100)
                             continue
 
                         new_effect = create_status_effect(
@@ -215,7 +215,7 @@ class CombatHandler:
                                     new_scales_with_attribute=applied_effect_obj.scales_with_attribute,
                                     new_attribute_potency_multiplier=applied_effect_obj.attribute_potency_multiplier
                                 )
-                                logger.info(f"Status-Effekt '{existing_effect.name}' auf '{current_target_char.name}' aufgefrischt.")
+                                logger.info("Status-Effekt '%s' auf '%s' aufgefrischt.", existing_effect.name, current_target_char.name)
                             else: # Neu oder stapelbar
                                 current_target_char.status_effects.append(new_effect)
                                 new_effect.on_apply()
@@ -226,13 +226,13 @@ def get_initiative_order(participants: List[CharacterInstance]) -> List[Characte
 
 def process_beginning_of_turn_effects(character: CharacterInstance):
     if character.is_defeated: return
-    logger.debug(f"--- Beginn des Zuges für {character.name} ---")
+    logger.debug("--- Beginn des Zuges für %s ---", character.name)
     effects_to_remove: List[StatusEffect] = []
     
     for effect in list(character.status_effects): 
         effect.on_tick() 
         if character.is_defeated: 
-            logger.debug(f"{character.name} wurde durch einen Effekt-Tick besiegt.")
+            logger.debug("%s wurde durch einen Effekt-Tick besiegt.", character.name)
             # Hier könnte man cli_output.display_character_status oder eine spezielle Nachricht ausgeben
             break             
         if effect.tick_duration(): 
@@ -53,15 +53,15 @@ class StatusEffect:
             scaled_potency_bonus = attr_bonus * attribute_potency_multiplier
             self.current_potency += scaled_potency_bonus
             self.current_potency = max(0, self.current_potency) # Potenz nicht negativ durch Skalierung
-            logger.debug(f"Effekt '{self.name}' Potenz von {potency} skaliert mit {scales_with_attribute} "
-                         f"(Bonus {attr_bonus} * Mult {attribute_potency_multiplier} = {scaled_potency_bonus}) "
-                         f"auf {self.current_potency} für Ziel '{target.name}'.")
+            logger.debug("Effekt '%s' Potenz von %s skaliert mit %s (Bonus %s * Mult %s = %s) auf %s für Ziel '%s'.",
+                         self.name, potency, scales_with_attribute, attr_bonus, attribute_potency_multiplier,
+                         scaled_potency_bonus, self.current_potency, target.name)
 
 
     def on_apply(self) -> None:
         """Wird einmalig ausgeführt, wenn der Effekt auf das Ziel angewendet wird."""
-        logger.info(f"Effekt '{self.name}' (Pot: {self.current_potency}, Dauer: {self.remaining_duration}R) "
-                    f"wurde auf '{self.target.name}' angewendet.")
+        logger.info("Effekt '%s' (Pot: %s, Dauer: %sR) wurde auf '%s' angewendet.",
+                    self.name, self.current_potency, self.remaining_duration, self.target.name)
         # Spezifische Logik für das Anwenden (z.B. einmalige Stat-Änderung)
         pass
 
@@ -76,7 +76,7 @@ class StatusEffect:
 
     def on_remove(self) -> None:
         """Wird einmalig ausgeführt, wenn der Effekt vom Ziel entfernt wird (abgelaufen oder dispellt)."""
-        logger.info(f"Effekt '{self.name}' wurde von '{self.target.name}' entfernt.")
+        logger.info("Effekt '%s' wurde von '%s' entfernt.", self.name, self.target.name)
         # Spezifische Logik für das Entfernen (z.B. Wiederherstellen von Stats)
         pass
 
@@ -115,8 +115,8 @@ class StatusEffect:
             self.current_potency += scaled_potency_bonus
             self.current_potency = max(0, self.current_potency)
         
-        logger.info(f"Effekt '{self.name}' auf '{self.target.name}' aufgefrischt. "
-                    f"Neue Dauer: {self.remaining_duration}R, neue Potenz: {self.current_potency} (vorher {old_potency}).")
+        logger.info("Effekt '%s' auf '%s' aufgefrischt. Neue Dauer: %sR, neue Potenz: %s (vorher %s).",
+                    self.name, self.target.name, self.remaining_duration, self.current_potency, old_potency)
 
 
     def __str__(self) -> str:
@@ -137,14 +137,14 @@ class BurningEffect(StatusEffect):
         super().on_tick()
         if self.target and not self.target.is_defeated:
             damage = int(self.current_potency) # Potenz ist hier der Schaden pro Tick
-            logger.info(f"'{self.target.name}' erleidet {damage} Schaden durch '{self.name}'.")
+            logger.info("'%s' erleidet %s Schaden durch '%s'.", self.target.name, damage, self.name)
             # Wichtig: Direkter Schaden, ignoriert Rüstung laut ANNEX
             self.target.current_hp -= damage # Direkte HP-Reduktion
             if self.target.current_hp <= 0:
                 self.target.current_hp = 0
                 self.target.is_defeated = True
                 self.target.can_act = False
-                logger.info(f"'{self.target.name}' wurde durch '{self.name}' besiegt!")
+                logger.info("'%s' wurde durch '%s' besiegt!", self.target.name, self.name)
             # Hier kein take_damage() verwenden, um Rüstung/Schild-Interaktion zu umgehen, falls so gewollt.
             # ANNEX: "Direkter Schaden (ignoriert Rüstung): potency Punkte pro Runde"
 
@@ -161,7 +161,7 @@ class StunnedEffect(StatusEffect):
         super().on_apply()
         if self.target:
             self.target.can_act = False
-            logger.debug(f"'{self.target.name}' kann aufgrund von '{self.name}' nicht handeln.")
+            logger.debug("'%s' kann aufgrund von '%s' nicht handeln.", self.target.name, self.name)
 
     def on_remove(self) -> None:
         super().on_remove()
@@ -172,9 +172,9 @@ class StunnedEffect(StatusEffect):
             is_still_stunned = any(isinstance(eff, StunnedEffect) for eff in self.target.status_effects if eff is not self)
             if not is_still_stunned:
                 self.target.can_act = True
-                logger.debug(f"'{self.target.name}' kann wieder handeln, da '{self.name}' entfernt wurde.")
+                logger.debug("'%s' kann wieder handeln, da '%s' entfernt wurde.", self.target.name, self.name)
             else:
-                logger.debug(f"'{self.target.name}' ist immer noch betäubt durch andere Effekte.")
+                logger.debug("'%s' ist immer noch betäubt durch andere Effekte.", self.target.name)
 
 
 class SlowedEffect(StatusEffect):
@@ -196,14 +196,14 @@ class SlowedEffect(StatusEffect):
             
             self.target.current_initiative -= self.initiative_reduction
             self.target.evasion -= self.evasion_reduction # Annahme: CharacterInstance hat 'evasion' Attribut
-            logger.debug(f"'{self.target.name}' Initiative -{self.initiative_reduction}, Evasion -{self.evasion_reduction} durch '{self.name}'.")
+            logger.debug("'%s' Initiative -%s, Evasion -%s durch '%s'.", self.target.name, self.initiative_reduction, self.evasion_reduction, self.name)
 
     def on_remove(self) -> None:
         super().on_remove()
         if self.target:
             self.target.current_initiative += self.initiative_reduction
             self.target.evasion += self.evasion_reduction
-            logger.debug(f"'{self.target.name}' Initiative +{self.initiative_reduction}, Evasion +{self.evasion_reduction} wiederhergestellt nach '{self.name}'.")
+            logger.debug("'%s' Initiative +%s, Evasion +%s wiederhergestellt nach '%s'.", self.target.name, self.initiative_reduction, self.evasion_reduction, self.name)
 
 
 class ShieldedEffect(StatusEffect):
@@ -227,7 +227,7 @@ class ShieldedEffect(StatusEffect):
             # Wenn ein neuer SHIELDED Effekt angewendet wird, während ein alter noch läuft,
             # wird der alte typischerweise entfernt und der neue angewendet.
             self.target.shield_points = max(self.target.shield_points, int(self.current_potency)) # Nimm den höheren Schildwert
-            logger.debug(f"'{self.target.name}' erhält Schildpunkte: {self.target.shield_points} durch '{self.name}'.")
+            logger.debug("'%s' erhält Schildpunkte: %s durch '%s'.", self.target.name, self.target.shield_points, self.name)
 
     def on_remove(self) -> None:
         super().on_remove()
@@ -242,7 +242,7 @@ class ShieldedEffect(StatusEffect):
             # ANNEX sagt nur "setzt die Schildpunkte". Es sagt nicht, was beim Ablauf passiert.
             # Logische Annahme: Der Schild bleibt, bis er weg ist oder der Effekt neu gesetzt wird.
             # Daher hier keine Aktion beim on_remove für shield_points.
-            logger.debug(f"Effekt '{self.name}' auf '{self.target.name}' entfernt. Schildpunkte bleiben bis aufgebraucht.")
+            logger.debug("Effekt '%s' auf '%s' entfernt. Schildpunkte bleiben bis aufgebraucht.", self.name, self.target.name)
             pass
 
 
@@ -261,13 +261,13 @@ class WeakenedEffect(StatusEffect):
         if self.target:
             self.str_reduction = int(self.current_potency)
             self.target.attributes["STR"] = self.target.attributes.get("STR", 10) - self.str_reduction
-            logger.debug(f"'{self.target.name}' STR -{self.str_reduction} durch '{self.name}'. Neu: {self.target.attributes['STR']}")
+            logger.debug("'%s' STR -%s durch '%s'. Neu: %s", self.target.name, self.str_reduction, self.name, self.target.attributes['STR'])
 
     def on_remove(self) -> None:
         super().on_remove()
         if self.target:
             self.target.attributes["STR"] = self.target.attributes.get("STR", 10) + self.str_reduction
-            logger.debug(f"'{self.target.name}' STR +{self.str_reduction} wiederhergestellt nach '{self.name}'. Neu: {self.target.attributes['STR']}")
+            logger.debug("'%s' STR +%s wiederhergestellt nach '%s'. Neu: %s", self.target.name, self.str_reduction, self.name, self.target.attributes['STR'])
 
 class AccuracyDownEffect(StatusEffect):
     """Reduziert Treffergenauigkeit."""
@@ -283,13 +283,13 @@ class AccuracyDownEffect(StatusEffect):
         if self.target:
             self.accuracy_reduction = int(self.current_potency)
             self.target.accuracy -= self.accuracy_reduction # Annahme: CharacterInstance.accuracy
-            logger.debug(f"'{self.target.name}' Genauigkeit -{self.accuracy_reduction} durch '{self.name}'.")
+            logger.debug("'%s' Genauigkeit -%s durch '%s'.", self.target.name, self.accuracy_reduction, self.name)
 
     def on_remove(self) -> None:
         super().on_remove()
         if self.target:
             self.target.accuracy += self.accuracy_reduction
-            logger.debug(f"'{self.target.name}' Genauigkeit +{self.accuracy_reduction} wiederhergestellt nach '{self.name}'.")
+            logger.debug("'%s' Genauigkeit +%s wiederhergestellt nach '%s'.", self.target.name, self.accuracy_reduction, self.name)
 
 
 class InitiativeUpEffect(StatusEffect):
@@ -306,13 +306,13 @@ class InitiativeUpEffect(StatusEffect):
         if self.target:
             self.initiative_increase = int(self.current_potency)
             self.target.current_initiative += self.initiative_increase
-            logger.debug(f"'{self.target.name}' Initiative +{self.initiative_increase} durch '{self.name}'.")
+            logger.debug("'%s' Initiative +%s durch '%s'.", self.target.name, self.initiative_increase, self.name)
 
     def on_remove(self) -> None:
         super().on_remove()
         if self.target:
             self.target.current_initiative -= self.initiative_increase
-            logger.debug(f"'{self.target.name}' Initiative -{self.initiative_increase} (normalisiert) nach '{self.name}'.")
+            logger.debug("'%s' Initiative -%s (normalisiert) nach '%s'.", self.target.name, self.initiative_increase, self.name)
 
 
 class DefenseUpEffect(StatusEffect):
@@ -330,14 +330,14 @@ class DefenseUpEffect(StatusEffect):
             self.defense_increase = int(self.current_potency)
             self.target.armor += self.defense_increase
             self.target.magic_resist += self.defense_increase
-            logger.debug(f"'{self.target.name}' Rüstung & MagRes +{self.defense_increase} durch '{self.name}'.")
+            logger.debug("'%s' Rüstung & MagRes +%s durch '%s'.", self.target.name, self.defense_increase, self.name)
 
     def on_remove(self) -> None:
         super().on_remove()
         if self.target:
             self.target.armor -= self.defense_increase
             self.target.magic_resist -= self.defense_increase
-            logger.debug(f"'{self.target.name}' Rüstung & MagRes -{self.defense_increase} (normalisiert) nach '{self.name}'.")
+            logger.debug("'%s' Rüstung & MagRes -%s (normalisiert) nach '%s'.", self.target.name, self.defense_increase, self.name)
 
 
 # --- Registrierung der Effektklassen ---
@@ -378,7 +378,7 @@ def create_status_effect(effect_id: str,
             logger.error(f"Fehler beim Erstellen der Effektinstanz für ID '{effect_id}': {e}")
             return None
     else:
-        logger.warning(f"Keine Effektklasse für ID '{effect_id}' in EFFECT_CLASS_MAP gefunden.")
+        logger.warning("Keine Effektklasse für ID '%s' in EFFECT_CLASS_MAP gefunden.", effect_id)
         return None
 
 
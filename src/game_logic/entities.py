@@ -3,15 +3,16 @@
 Enthält die Klasse CharacterInstance, die eine konkrete Instanz eines Charakters
 oder Gegners im Spiel repräsentiert, inklusive aktuellem Zustand.
 """
-import uuid # Für eindeutige Instanz-IDs
+import itertools # Monotoner Zähler für eindeutige Instanz-IDs
+import copy
 import logging
 import math # Hinzugefügt, falls für Formeln benötigt, die hier direkt aufgerufen werden könnten
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 
 # Importiere Template-Klassen und Formeln
 from src.definitions.character import CharacterTemplate
 from src.definitions.opponent import OpponentTemplate
-from src.definitions.skill import SkillTemplate # KORREKTUR: SkillTemplate für Typ-Hinweis importieren
+from src.definitions.skill import SkillTemplate, resolve_resource_key # KORREKTUR: SkillTemplate für Typ-Hinweis importieren
 from src.game_logic import formulas 
 # from .effects import StatusEffect # Wird später für Status-Effekte benötigt (wenn StatusEffect-Objekte hier direkt gehandhabt werden)
 
@@ -28,13 +29,29 @@ except ImportError:
     logger.critical("FATAL: Konfigurationsmodul src.config.config konnte nicht importiert werden in entities.py.")
     CONFIG = None 
 
+# Prozessweiter Zähler für Instanz-IDs (z.B. "goblin_lv1_17"): kollisionsfrei und ohne Zufallszahlen/UUIDs
+_instance_id_counter = itertools.count(1)
+
+def _next_instance_id(template_id: str) -> str:
+    return f"{template_id}_{next(_instance_id_counter)}"
+
 class CharacterInstance:
+    # Feste Attributmenge: schnellerer Attributzugriff in der Kampfschleife und kein __dict__ pro Instanz.
+    # Neue Instanzattribute müssen hier ergänzt werden.
+    __slots__ = (
+        "instance_id", "base_template", "name", "attributes", "level", "xp", "xp_for_next_level",
+        "max_hp", "current_hp", "max_mana", "current_mana", "max_stamina", "current_stamina",
+        "max_energy", "current_energy", "shield_points", "armor", "magic_resist", "accuracy", "evasion",
+        "base_initiative", "current_initiative", "is_defeated", "can_act", "status_effects", "skills",
+        "_skill_filters", "_skill_filters_source", "_offensive_first_filters",
+    )
+
     def __init__(self,
                  base_template: CharacterTemplate | OpponentTemplate,
                  instance_id: Optional[str] = None,
                  name_override: Optional[str] = None):
         
-        self.instance_id: str = instance_id if instance_id else str(uuid.uuid4())
+        self.instance_id: str = instance_id if instance_id else _next_instance_id(base_template.id)
         self.base_template: CharacterTemplate | OpponentTemplate = base_template
         
         self.name: str = name_override if name_override else self.base_template.name
@@ -54,6 +71,11 @@ class CharacterInstance:
 
         self.skills: List[str] = list(getattr(self.base_template, 'skills', [])) or \
                                   list(getattr(self.base_template, 'starting_skills', []))
+        # Cache für get_usable_skill_ids: (skill_id, Ressourcen-Attribut, Kosten, statisch leistbar)
+        self._skill_filters: Optional[List[Tuple[str, Optional[str], int, bool]]] = None
+        self._skill_filters_source: Optional[Tuple[Dict[str, SkillTemplate], List[str]]] = None
+        # Dieselben Filter, offensive Skills (mit direkten Effekten) zuerst; für get_preferred_skill_id
+        self._offensive_first_filters: Optional[List[Tuple[str, Optional[str], int, bool]]] = None
 
 
         self.level: int = getattr(self.base_template, 'level', 1) 
@@ -68,9 +90,33 @@ class CharacterInstance:
         self.accuracy: int = template_cv.get("accuracy", 0) 
         self.evasion: int = template_cv.get("evasion", 0)   
 
-        logger.info(f"Charakter-Instanz '{self.name}' (ID: {self.instance_id}) erstellt "
-                    f"basiert auf Template '{self.base_template.id}'. "
-                    f"HP: {self.current_hp}/{self.max_hp}")
+        logger.info("Charakter-Instanz '%s' (ID: %s) erstellt basiert auf Template '%s'. HP: %s/%s",
+                    self.name, self.instance_id, self.base_template.id, self.current_hp, self.max_hp)
+
+    def clone(self, name_override: Optional[str] = None, instance_id: Optional[str] = None) -> 'CharacterInstance':
+        """
+        Erstellt eine unabhängige Kopie dieser Instanz (z.B. von einem frisch erstellten Prototyp),
+        ohne Werte und Formeln erneut aus dem Template zu berechnen.
+        Veränderliche Container (Attribute, Skills, Status-Effekte) werden kopiert, das Template wird geteilt.
+        Bereits vorberechnete Skill-Filter (siehe prepare_skill_cache) übernimmt die Kopie.
+        """
+        new_instance = copy.copy(self)
+        new_instance.instance_id = instance_id if instance_id else _next_instance_id(self.base_template.id)
+        new_instance.name = name_override if name_override else self.base_template.name
+        new_instance.attributes = dict(self.attributes)
+        new_instance.skills = list(self.skills)
+        new_instance.status_effects = copy.deepcopy(self.status_effects) if self.status_effects else []
+        if self._skill_filters_source is not None:
+            # Filter hängen nur von Skill-Liste und Definitionen ab, nicht vom Ressourcenstand -> teilen
+            new_instance._skill_filters_source = (self._skill_filters_source[0], new_instance.skills)
+        logger.debug("Charakter-Instanz '%s' (ID: %s) als Kopie von '%s' erstellt.",
+                     new_instance.name, new_instance.instance_id, self.name)
+        return new_instance
+
+    @property
+    def has_active_effects(self) -> bool:
+        """True, solange mindestens ein Statuseffekt aktiv ist (ohne Effekte ist der Zugbeginn ein No-op)."""
+        return bool(self.status_effects)
 
     def _initialize_combat_stats(self):
         self.max_hp: int = formulas.calculate_max_hp(
@@ -118,10 +164,10 @@ class CharacterInstance:
             absorbed_by_shield = min(self.shield_points, actual_damage_after_reduction)
             self.shield_points -= absorbed_by_shield
             actual_damage_after_reduction -= absorbed_by_shield
-            logger.debug(f"'{self.name}' absorbiert {absorbed_by_shield} Schaden mit Schild. Restschaden: {actual_damage_after_reduction}. Schild verbleibend: {self.shield_points}")
+            logger.debug("'%s' absorbiert %s Schaden mit Schild. Restschaden: %s. Schild verbleibend: %s", self.name, absorbed_by_shield, actual_damage_after_reduction, self.shield_points)
 
         if actual_damage_after_reduction <= 0: 
-            logger.info(f"'{self.name}' erleidet keinen HP-Schaden (abgewehrt/absorbiert).")
+            logger.info("'%s' erleidet keinen HP-Schaden (abgewehrt/absorbiert).", self.name)
             return 0 # Nur der Schildschaden wurde verursacht, kein HP-Schaden
 
         hp_damage_taken = actual_damage_after_reduction
@@ -132,13 +178,13 @@ class CharacterInstance:
             self.current_hp = 0
             self.is_defeated = True
             self.can_act = False 
-            logger.info(f"'{self.name}' wurde besiegt!")
+            logger.info("'%s' wurde besiegt!", self.name)
         
         return hp_damage_taken # Gibt den tatsächlich an HP verursachten Schaden zurück
 
     def heal(self, amount: int) -> int:
         if self.is_defeated: 
-            logger.info(f"'{self.name}' ist besiegt und kann nicht geheilt werden.")
+            logger.info("'%s' ist besiegt und kann nicht geheilt werden.", self.name)
             return 0
         if amount <= 0: return 0
             
@@ -155,47 +201,39 @@ class CharacterInstance:
         if resource_type_upper == "MANA":
             restored_amount = min(amount, self.max_mana - self.current_mana)
             self.current_mana += restored_amount
-            logger.debug(f"'{self.name}' stellt {restored_amount} Mana wieder her. Mana: {self.current_mana}/{self.max_mana}")
+            logger.debug("'%s' stellt %s Mana wieder her. Mana: %s/%s", self.name, restored_amount, self.current_mana, self.max_mana)
         elif resource_type_upper == "STAMINA":
             restored_amount = min(amount, self.max_stamina - self.current_stamina)
             self.current_stamina += restored_amount
-            logger.debug(f"'{self.name}' stellt {restored_amount} Stamina wieder her. Stamina: {self.current_stamina}/{self.max_stamina}")
+            logger.debug("'%s' stellt %s Stamina wieder her. Stamina: %s/%s", self.name, restored_amount, self.current_stamina, self.max_stamina)
         elif resource_type_upper == "ENERGY":
             restored_amount = min(amount, self.max_energy - self.current_energy)
             self.current_energy += restored_amount
-            logger.debug(f"'{self.name}' stellt {restored_amount} Energy wieder her. Energy: {self.current_energy}/{self.max_energy}")
+            logger.debug("'%s' stellt %s Energy wieder her. Energy: %s/%s", self.name, restored_amount, self.current_energy, self.max_energy)
         else:
-            logger.warning(f"Unbekannter Ressourcentyp '{resource_type}' für Wiederherstellung bei '{self.name}'.")
+            logger.warning("Unbekannter Ressourcentyp '%s' für Wiederherstellung bei '%s'.", resource_type, self.name)
         return restored_amount
 
     def consume_resource(self, amount: int, resource_type: Optional[str]) -> bool: # resource_type kann None sein
         if amount < 0: return True 
         if amount == 0: return True 
 
-        if resource_type is None: # Manche Skills haben type: null in JSON, als NONE interpretieren
-            resource_type_upper = "NONE"
-        else:
-            resource_type_upper = resource_type.upper()
-        
-        current_value = 0
-        if resource_type_upper == "MANA": current_value = self.current_mana
-        elif resource_type_upper == "STAMINA": current_value = self.current_stamina
-        elif resource_type_upper == "ENERGY": current_value = self.current_energy
-        elif resource_type_upper == "NONE":
-            logger.debug(f"'{self.name}' führt eine Aktion ohne Ressourcenkosten aus.")
+        # Manche Skills haben type: null in JSON, resolve_resource_key interpretiert das als NONE
+        resource_type_upper, current_attr = resolve_resource_key(resource_type)
+        if resource_type_upper == "NONE":
+            logger.debug("'%s' führt eine Aktion ohne Ressourcenkosten aus.", self.name)
             return True
-        else: # Unbekannter Ressourcentyp
-            logger.warning(f"'{self.name}' versucht, unbekannte Ressource '{resource_type}' zu verbrauchen.")
+        if current_attr is None: # Unbekannter Ressourcentyp
+            logger.warning("'%s' versucht, unbekannte Ressource '%s' zu verbrauchen.", self.name, resource_type)
             return False # Kann nicht verbraucht werden
 
+        current_value = getattr(self, current_attr)
         if current_value >= amount:
-            if resource_type_upper == "MANA": self.current_mana -= amount
-            elif resource_type_upper == "STAMINA": self.current_stamina -= amount
-            elif resource_type_upper == "ENERGY": self.current_energy -= amount
-            logger.debug(f"'{self.name}' verbraucht {amount} {resource_type_upper}. Verbleibend: {getattr(self, 'current_' + resource_type_upper.lower())}")
+            setattr(self, current_attr, current_value - amount)
+            logger.debug("'%s' verbraucht %s %s. Verbleibend: %s", self.name, amount, resource_type_upper, current_value - amount)
             return True
         
-        logger.warning(f"Nicht genügend {resource_type_upper} für '{self.name}' (benötigt {amount}, hat {current_value}).")
+        logger.warning("Nicht genügend %s für '%s' (benötigt %s, hat %s).", resource_type_upper, self.name, amount, current_value)
         return False
 
     # KORREKTUR: Hinzufügen der can_afford_skill Methode
@@ -204,39 +242,81 @@ class CharacterInstance:
         if not skill_template:
             return False
         
-        cost_type = skill_template.cost.type
-        cost_value = skill_template.cost.value
+        cost = skill_template.cost
+        cost_value = cost.value
 
         if cost_value == 0: # Kostenlose Skills sind immer leistbar
             return True
 
-        cost_type_upper = ""
-        if cost_type: # Sicherstellen, dass cost_type nicht None ist
-            cost_type_upper = cost_type.upper()
-        else: # Wenn type null ist, aber Kosten > 0, ist das ein Definitionsfehler
+        if not cost.type: # Wenn type null ist, aber Kosten > 0, ist das ein Definitionsfehler
             logger.error(f"Skill '{skill_template.name}' hat Kosten ({cost_value}) aber keinen Ressourcentyp (type: null).")
             return False
 
-
-        if cost_type_upper == "NONE": # Sollte durch cost_value == 0 abgedeckt sein, aber zur Sicherheit
+        if cost.type_upper == "NONE": # Sollte durch cost_value == 0 abgedeckt sein, aber zur Sicherheit
             return True
-        elif cost_type_upper == "MANA":
-            return self.current_mana >= cost_value
-        elif cost_type_upper == "STAMINA":
-            return self.current_stamina >= cost_value
-        elif cost_type_upper == "ENERGY":
-            return self.current_energy >= cost_value
+        if cost.current_attr is not None: # Attributname wurde beim Laden des Skills vorberechnet
+            return getattr(self, cost.current_attr) >= cost_value
         
-        logger.warning(f"Unbekannter Ressourcentyp '{skill_template.cost.type}' bei der Kostenprüfung für Skill '{skill_template.name}'.")
+        logger.warning("Unbekannter Ressourcentyp '%s' bei der Kostenprüfung für Skill '%s'.", cost.type, skill_template.name)
         return False
 
 
+    def _get_skill_filters(self, skill_definitions: Dict[str, SkillTemplate]) -> List[Tuple[str, Optional[str], int, bool]]:
+        """
+        Baut einmalig pro Instanz (und Skill-Liste) die Filter-Tupel für die Kostenprüfung.
+        Nur der aktuelle Ressourcenstand ist dynamisch, alles andere wird hier vorberechnet.
+        """
+        source = self._skill_filters_source
+        if self._skill_filters is not None and source is not None and \
+           source[0] is skill_definitions and source[1] is self.skills:
+            return self._skill_filters
+
+        filters: List[Tuple[str, Optional[str], int, bool]] = []
+        offensive_ids = set()
+        for skill_id in self.skills:
+            skill_template = skill_definitions.get(skill_id)
+            if not skill_template:
+                continue
+            if skill_template.direct_effects:
+                offensive_ids.add(skill_id)
+            cost = skill_template.cost
+            if cost.value == 0 or cost.current_attr is None:
+                # Kein dynamischer Anteil: Ergebnis von can_afford_skill ist konstant
+                filters.append((skill_id, None, cost.value, self.can_afford_skill(skill_template)))
+            else:
+                filters.append((skill_id, cost.current_attr, cost.value, False))
+        self._skill_filters = filters
+        self._skill_filters_source = (skill_definitions, self.skills)
+        # Stabile Sortierung: innerhalb der Gruppen bleibt die Reihenfolge von self.skills erhalten
+        self._offensive_first_filters = sorted(filters, key=lambda f: f[0] not in offensive_ids)
+        return filters
+
+    def prepare_skill_cache(self, skill_definitions: Dict[str, SkillTemplate]) -> None:
+        """Berechnet die Skill-Filter vorab (z.B. direkt bei der Erstellung), statt beim ersten Zug."""
+        self._get_skill_filters(skill_definitions)
+
+    def get_usable_skill_ids(self, skill_definitions: Dict[str, SkillTemplate]) -> List[str]:
+        """Gibt die IDs aller aktuell leistbaren Skills in der Reihenfolge von self.skills zurück."""
+        return [skill_id for skill_id, current_attr, cost_value, static_ok in self._get_skill_filters(skill_definitions)
+                if (static_ok if current_attr is None else getattr(self, current_attr) >= cost_value)]
+
+    def get_preferred_skill_id(self, skill_definitions: Dict[str, SkillTemplate]) -> Optional[str]:
+        """
+        Gibt den ersten leistbaren offensiven Skill (mit direkten Effekten) zurück, sonst den ersten
+        leistbaren Skill überhaupt; None, wenn keiner leistbar ist.
+        """
+        self._get_skill_filters(skill_definitions)
+        for skill_id, current_attr, cost_value, static_ok in self._offensive_first_filters:
+            if static_ok if current_attr is None else getattr(self, current_attr) >= cost_value:
+                return skill_id
+        return None
+
     def add_xp(self, amount: int):
         if self.is_defeated or amount <= 0:
             return
 
         self.xp += amount
-        logger.info(f"'{self.name}' erhält {amount} XP. Gesamt-XP: {self.xp}/{self.xp_for_next_level}")
+        logger.info("'%s' erhält %s XP. Gesamt-XP: %s/%s", self.name, amount, self.xp, self.xp_for_next_level)
         
         while self.xp >= self.xp_for_next_level:
             self._level_up()
@@ -250,14 +330,14 @@ class CharacterInstance:
         self.xp_for_next_level = formulas.calculate_xp_for_next_level(self.level)
         
         # Ausgabe des Level-Ups über cli_output im Hauptloop, hier nur Log
-        logger.info(f"LEVEL UP! '{self.name}' hat Level {self.level} erreicht! Nächstes Level bei {self.xp_for_next_level} XP.")
+        logger.info("LEVEL UP! '%s' hat Level %s erreicht! Nächstes Level bei %s XP.", self.name, self.level, self.xp_for_next_level)
         
         self.current_hp = self.max_hp
         self.current_mana = self.max_mana
         self.current_stamina = self.max_stamina
         self.current_energy = self.max_energy
         self.shield_points = 0 
-        logger.info(f"'{self.name}' wurde vollständig geheilt und Ressourcen wiederhergestellt.")
+        logger.info("'%s' wurde vollständig geheilt und Ressourcen wiederhergestellt.", self.name)
         
     def get_info(self) -> Dict[str, Any]:
         return {
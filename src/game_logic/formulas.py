@@ -33,7 +33,6 @@ except ImportError:
             return default
     CONFIG = FallbackConfig()
 
-
 def calculate_attribute_bonus(attribute_value: int) -> int:
     """
     Berechnet den Bonus (oder Malus) basierend auf einem Attributwert.
@@ -113,17 +112,17 @@ def calculate_hit_chance(accuracy: int, # Genauigkeit des Angreifers
         cfg_max_chance = CONFIG.get("game_settings.hit_chance_max", 95)
         if base_chance_override is not None:
             # logger.debug(f"Trefferchance-Override verwendet: {base_chance_override}%")
-            return max(cfg_min_chance, min(cfg_max_chance, base_chance_override))
+            return int(max(cfg_min_chance, min(cfg_max_chance, base_chance_override)))
         
         cfg_base_chance = CONFIG.get("game_settings.hit_chance_base", 90)
         cfg_acc_factor = CONFIG.get("game_settings.hit_chance_accuracy_factor", 3)
         cfg_eva_factor = CONFIG.get("game_settings.hit_chance_evasion_factor", 2)
     elif base_chance_override is not None: # Fallback wenn CONFIG nicht da, aber Override schon
-        return max(cfg_min_chance, min(cfg_max_chance, base_chance_override))
+        return int(max(cfg_min_chance, min(cfg_max_chance, base_chance_override)))
 
 
     hit_chance_val = cfg_base_chance + (accuracy * cfg_acc_factor) - (evasion * cfg_eva_factor)
-    final_hit_chance = max(cfg_min_chance, min(cfg_max_chance, hit_chance_val))
+    final_hit_chance = int(max(cfg_min_chance, min(cfg_max_chance, hit_chance_val)))
     
     # logger.debug(f"Trefferchance berechnet: Basis={cfg_base_chance}, Acc={accuracy}(*{cfg_acc_factor}), Eva={evasion}(*{cfg_eva_factor}) -> Roh={hit_chance_val} -> Final={final_hit_chance}%")
     return final_hit_chance
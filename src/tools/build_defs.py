@@ -0,0 +1,77 @@
+# src/tools/build_defs.py
+"""
+Erzeugt binäre Snapshots (Pickle) der statischen JSON5-Definitionsdateien.
+Der Loader (src.definitions.loader) bevorzugt einen Snapshot, solange er nicht älter
+als die zugehörige JSON5-Datei ist, und spart sich damit das langsame JSON5-Parsen.
+
+Mit --python-modules werden zusätzlich Python-Module mit den Daten als Literal erzeugt
+(src/definitions/generated/<name>_data.py). Diese lädt der Loader per import; Python
+cached sie als .pyc, sodass beim Start gar nichts mehr geparst werden muss.
+
+Aufruf aus dem Projekt-Root: python -m src.tools.build_defs [--python-modules]
+"""
+import os
+import sys
+import pickle
+import pprint
+import argparse
+import logging
+from typing import List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path: sys.path.insert(0, PROJECT_ROOT)
+
+from src.definitions.loader import (CHARACTERS_FILE, SKILLS_FILE, OPPONENTS_FILE, GENERATED_DIR,
+                                    get_snapshot_path, get_literal_module_path, parse_definition_bytes)
+
+logger = logging.getLogger(__name__)
+
+DEFINITION_FILES: List[str] = [CHARACTERS_FILE, SKILLS_FILE, OPPONENTS_FILE]
+
+def build_snapshot(file_path: str) -> str:
+    """Parst eine JSON5-Datei und schreibt sie als Pickle (Protokoll 5) daneben. Gibt den Snapshot-Pfad zurück."""
+    with open(file_path, 'rb') as f:
+        data = parse_definition_bytes(f.read())
+    snapshot_path = get_snapshot_path(file_path)
+    tmp_path = snapshot_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(data, f, protocol=5)
+    os.replace(tmp_path, snapshot_path) # Atomar, damit der Loader nie einen halben Snapshot sieht
+    return snapshot_path
+
+def build_literal_module(file_path: str) -> str:
+    """Parst eine JSON5-Datei und schreibt sie als Python-Modul mit DATA = {...}. Gibt den Modulpfad zurück."""
+    with open(file_path, 'rb') as f:
+        data = parse_definition_bytes(f.read())
+    os.makedirs(GENERATED_DIR, exist_ok=True)
+    init_path = os.path.join(GENERATED_DIR, "__init__.py")
+    if not os.path.isfile(init_path):
+        with open(init_path, 'w', encoding='utf-8') as f:
+            f.write("# Automatisch erzeugt von src/tools/build_defs.py\n")
+    module_path = get_literal_module_path(file_path)
+    tmp_path = module_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f"# Automatisch erzeugt von src/tools/build_defs.py aus {os.path.basename(file_path)} - nicht bearbeiten.\n")
+        f.write(f"DATA = {pprint.pformat(data, indent=1, width=120, sort_dicts=False)}\n")
+    os.replace(tmp_path, module_path)
+    return module_path
+
+def build_all_snapshots() -> List[str]:
+    """Erzeugt Snapshots für alle Definitionsdateien."""
+    return [build_snapshot(file_path) for file_path in DEFINITION_FILES]
+
+def build_all_literal_modules() -> List[str]:
+    """Erzeugt Python-Literal-Module für alle Definitionsdateien."""
+    return [build_literal_module(file_path) for file_path in DEFINITION_FILES]
+
+if __name__ == '__main__':
+    if not logging.getLogger().hasHandlers():
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Erzeugt vorgeparste Varianten der Definitionsdateien.")
+    parser.add_argument("--python-modules", action="store_true", help="Zusätzlich Python-Module mit den Daten als Literal erzeugen.")
+    args = parser.parse_args()
+    for snapshot in build_all_snapshots():
+        logger.info(f"Snapshot geschrieben: {snapshot}")
+    if args.python_modules:
+        for module_path in build_all_literal_modules():
+            logger.info(f"Python-Modul geschrieben: {module_path}")
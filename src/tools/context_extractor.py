@@ -2,19 +2,32 @@
 import os
 import sys
 import json # Für das finale Schreiben als JSON, wenn gewünscht (oder Markdown)
-import json5 # Zum Laden der JSON5-Dateien
 import inspect 
+import types
+import linecache
 import datetime
 import logging
 import importlib # Für import_module
+import importlib.util
+import hashlib
+import struct
+import operator
+import functools
+import pickle
+import glob
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List, Any, Union
 
 # --- Pfad Setup ---
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Datei liegt in <Projekt>/src/tools/ -> drei Ebenen nach oben
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 SRC_DIR = os.path.join(PROJECT_ROOT, "src")
 
-if SRC_DIR not in sys.path: sys.path.insert(0, SRC_DIR)
-if PROJECT_ROOT not in sys.path: sys.path.insert(0, PROJECT_ROOT)
+# sys.path nur einmal pro Prozess prüfen/ergänzen (Merker direkt am sys-Modul, übersteht auch reload())
+if not getattr(sys, "_ctx_extractor_path_ready", False):
+    for _path in (SRC_DIR, PROJECT_ROOT):
+        if _path not in sys.path: sys.path.insert(0, _path)
+    sys._ctx_extractor_path_ready = True
 
 logger = logging.getLogger(__name__) 
 
@@ -51,62 +64,381 @@ _CODE_SNIPPETS_TO_EXTRACT_CONFIG = {
 
 _FILES_TO_INCLUDE_FULL_CONTENT_CONFIG: List[str] = [] # Standardmäßig leer
 
+# Persistenter Cache für geparste JSON5-Dateien und extrahierte Quelltexte (Schlüssel: Pfad, mtime, Größe).
+# Pro Datei/Objekt wird nur der aktuelle Eintrag behalten; veraltete Stände werden beim Schreiben entfernt.
+_DISK_CACHE_DIR = os.path.join(PROJECT_ROOT, "logs", "context_extractor_cache")
+_EXTRACTOR_MAX_WORKERS = 8 # Threads für das parallele Laden von JSON- und Volltext-Dateien (I/O-lastig)
+
 # --- Hilfsfunktionen ---
+@functools.lru_cache(maxsize=None)
+def _cached_import(module_path: str):
+    """Importiert ein Modul einmalig pro Pfad. Nur aus dem Haupt-Thread aufrufen (nicht aus dem Thread-Pool)."""
+    return importlib.import_module(module_path)
+
+@functools.lru_cache(maxsize=256)
+def _cached_getsource(obj: Any) -> str:
+    """inspect.getsource mit Cache pro Objekt (Datei wird nur beim ersten Zugriff gelesen und tokenisiert)."""
+    return inspect.getsource(obj)
+
+@functools.lru_cache(maxsize=None)
+def _module_member_index(module_path: str) -> Dict[str, Any]:
+    """
+    Index Methodenname -> Funktion/Methode über alle im Modul definierten Klassen (inkl. geerbter Methoden),
+    einmalig pro Modul aufgebaut. Bei gleichem Namen gewinnt die zuerst definierte Klasse.
+    """
+    module = _cached_import(module_path)
+    index: Dict[str, Any] = {}
+    for member_class in module.__dict__.values():
+        if not (isinstance(member_class, type) and member_class.__module__ == module.__name__):
+            continue
+        for klass in member_class.__mro__:
+            if klass is object: continue
+            for member_name in klass.__dict__:
+                if member_name in index: continue
+                candidate = getattr(member_class, member_name, None)
+                if inspect.isfunction(candidate) or inspect.ismethod(candidate):
+                    index[member_name] = candidate
+    return index
+
 def get_source_code(module_path: str, object_name: str) -> Optional[str]:
     try:
-        module = importlib.import_module(module_path)
+        module = _cached_import(module_path)
+    except ImportError: logger.error(f"CE: Modul '{module_path}' nicht importierbar."); return f"FEHLER: Modul '{module_path}' nicht importierbar."
+    except Exception as e: logger.error(f"CE: Fehler Extrahieren {module_path}.{object_name}: {e}", exc_info=True); return f"FEHLER: Unerwarteter Fehler."
+    return _get_source_from_module(module, object_name, module_path)
+
+_INSPECTABLE_TYPES = (type, types.FunctionType, types.MethodType) # entspricht inspect.isclass/isfunction/ismethod
+
+def _get_source_from_module(module: Any, object_name: str, module_path: str) -> Optional[str]:
+    """Quelltext eines Objekts aus einem bereits importierten Modul (module_path für Index und Fehlermeldungen)."""
+    try:
         obj_to_inspect = None
-        if hasattr(module, object_name):
-            candidate = getattr(module, object_name)
-            if inspect.isfunction(candidate) or inspect.isclass(candidate) or inspect.ismethod(candidate):
-                obj_to_inspect = candidate
-        if not obj_to_inspect:
-            for _, member_class in inspect.getmembers(module, inspect.isclass):
-                if member_class.__module__ == module.__name__:
-                    if hasattr(member_class, object_name):
-                        candidate = getattr(member_class, object_name)
-                        if inspect.isfunction(candidate) or inspect.ismethod(candidate):
-                            obj_to_inspect = candidate; break
+        candidate = module.__dict__.get(object_name) # Ein Dict-Lookup statt hasattr/getattr + drei inspect.is*-Prüfungen
+        if isinstance(candidate, _INSPECTABLE_TYPES):
+            obj_to_inspect = candidate
+        if not obj_to_inspect: # Methode einer Klasse des Moduls: ein Dict-Lookup im vorab gebauten Index
+            obj_to_inspect = _module_member_index(module_path).get(object_name)
         if obj_to_inspect:
             try:
                 if inspect.ismethod(obj_to_inspect): obj_to_inspect = obj_to_inspect.__func__
-                return inspect.getsource(obj_to_inspect)
+                return _cached_getsource(obj_to_inspect)
             except (TypeError, OSError) as e:
                 logger.warning(f"CE: Quellcode für {module_path}.{object_name} nicht geladen: {e}"); return f"FEHLER: Code nicht ladbar ({type(obj_to_inspect)})"
         else:
             logger.warning(f"CE: Objekt '{object_name}' nicht in '{module_path}' gefunden."); return f"FEHLER: Objekt '{object_name}' nicht gefunden."
-    except ImportError: logger.error(f"CE: Modul '{module_path}' nicht importierbar."); return f"FEHLER: Modul '{module_path}' nicht importierbar."
     except Exception as e: logger.error(f"CE: Fehler Extrahieren {module_path}.{object_name}: {e}", exc_info=True); return f"FEHLER: Unerwarteter Fehler."
 
-def format_data_for_markdown(data: Union[Dict, List], indent_level: int = 0) -> str: # Umbenannt für Klarheit
-    lines = []
-    indent_str = "  " * indent_level
-    items_to_iterate = sorted(data.items()) if isinstance(data, dict) else enumerate(data)
+_json5 = None # json5 (reines Python, langsamer Import) wird erst bei Bedarf geladen
+
+def _get_json5():
+    """Importiert json5 beim ersten Aufruf und liefert das Modul."""
+    global _json5
+    if _json5 is None:
+        import json5 as _json5_module
+        _json5 = _json5_module
+    return _json5
+
+def _parse_json_or_json5(raw: bytes) -> Any:
+    """Parst mit dem schnellen json-Modul; nur bei echter JSON5-Syntax (Kommentare etc.) Fallback auf json5."""
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return _get_json5().loads(raw.decode('utf-8'))
+
+def _disk_cache_file(kind: str, file_path: str, st: os.stat_result, extra: str = "") -> str:
+    """
+    Pfad der Cache-Datei für (Art, Datei, Zusatz) und (mtime, Größe) als "<Eintrag>_<Stand>.pkl".
+    Ändert sich die Datei, ändert sich nur der Stand-Teil des Namens.
+    """
+    entry_key = f"{kind}|{file_path}|{extra}".encode('utf-8')
+    version_key = f"{st.st_mtime_ns}|{st.st_size}".encode('utf-8')
+    entry_hash = hashlib.blake2b(entry_key, digest_size=16).hexdigest()
+    version_hash = hashlib.blake2b(version_key, digest_size=8).hexdigest()
+    return os.path.join(_DISK_CACHE_DIR, f"{entry_hash}_{version_hash}.pkl")
+
+def _disk_cache_load(cache_file: str) -> Any:
+    """Lädt einen Cache-Eintrag; None bei fehlendem oder unlesbarem Eintrag."""
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"CE: Cache-Eintrag '{cache_file}' unbrauchbar: {e}")
+        return None
+
+def _disk_cache_store(cache_file: str, value: Any) -> None:
+    """Schreibt einen Cache-Eintrag atomar (temporäre Datei + os.replace); Fehler werden nur geloggt."""
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.debug(f"CE: Cache-Eintrag '{cache_file}' nicht geschrieben: {e}")
+        return
+    _disk_cache_evict_stale(cache_file)
+
+def _disk_cache_evict_stale(cache_file: str) -> None:
+    """Entfernt ältere Stände desselben Eintrags (gleiche Art/Datei/Zusatz, andere mtime/Größe)."""
+    entry_hash = os.path.basename(cache_file).split('_', 1)[0]
+    for stale_file in glob.glob(os.path.join(_DISK_CACHE_DIR, f"{entry_hash}_*.pkl")):
+        if stale_file == cache_file:
+            continue
+        try:
+            os.remove(stale_file)
+        except OSError as e:
+            logger.debug(f"CE: Veralteter Cache-Eintrag '{stale_file}' nicht entfernt: {e}")
+
+def load_json_file_cached(abs_file_path: str, use_cache: bool = True) -> Any:
+    """Lädt eine JSON(5)-Datei, bei unveränderter Datei aus dem Disk-Cache. FileNotFoundError wird durchgereicht."""
+    if not use_cache:
+        with open(abs_file_path, 'rb') as f:
+            return _parse_json_or_json5(f.read())
+    cache_file = _disk_cache_file("json", abs_file_path, os.stat(abs_file_path))
+    cached = _disk_cache_load(cache_file)
+    if cached is not None:
+        return cached[0]
+    with open(abs_file_path, 'rb') as f:
+        data = _parse_json_or_json5(f.read())
+    _disk_cache_store(cache_file, (data,)) # In Tupel verpackt, damit auch None/leere Daten cachebar sind
+    return data
+
+def _prime_linecache(module: Any) -> None:
+    """Liest die Quelldatei eines Moduls einmal in den linecache, den inspect.getsource für alle Objekte daraus nutzt."""
+    try:
+        source_file = inspect.getsourcefile(module)
+    except TypeError: # Builtin-/Erweiterungsmodul ohne Python-Quelle
+        return
+    if source_file:
+        linecache.checkcache(source_file)
+        linecache.getlines(source_file, module.__dict__)
+
+def extract_module_snippets(module_path: str, object_names: List[str], use_cache: bool = True) -> Dict[str, Optional[str]]:
+    """
+    Extrahiert die Quelltexte mehrerer Objekte eines Moduls: Disk-Cache pro (Moduldatei, mtime, Größe, Objektname),
+    für die restlichen Objekte genau ein Import des Moduls (Importfehler werden einmal pro Modul geloggt).
+    Sind alle Objekte im Cache, wird das Modul nicht importiert. Fehlermeldungen werden nicht gecacht.
+    """
+    cache_files: Dict[str, str] = {}
+    if use_cache:
+        try:
+            spec = importlib.util.find_spec(module_path)
+            module_file = spec.origin if spec else None
+            if module_file:
+                st = os.stat(module_file)
+                cache_files = {name: _disk_cache_file("source", module_file, st, name) for name in object_names}
+        except (ImportError, ValueError, OSError):
+            pass
+
+    sources: Dict[str, Optional[str]] = {}
+    for object_name, cache_file in cache_files.items():
+        cached = _disk_cache_load(cache_file)
+        if cached is not None:
+            sources[object_name] = cached
+
+    missing = [name for name in object_names if name not in sources]
+    if missing:
+        module, import_error = None, None
+        try:
+            module = _cached_import(module_path)
+        except ImportError:
+            logger.error(f"CE: Modul '{module_path}' nicht importierbar.")
+            import_error = f"FEHLER: Modul '{module_path}' nicht importierbar."
+        except Exception as e:
+            logger.error(f"CE: Fehler beim Import von {module_path}: {e}", exc_info=True)
+            import_error = "FEHLER: Unerwarteter Fehler."
+        if module is not None and len(missing) > 1:
+            _prime_linecache(module)
+        for object_name in missing:
+            if import_error:
+                sources[object_name] = import_error
+                continue
+            source = _get_source_from_module(module, object_name, module_path)
+            sources[object_name] = source
+            cache_file = cache_files.get(object_name)
+            if cache_file and source and not source.startswith("FEHLER:"):
+                _disk_cache_store(cache_file, source)
+    return {name: sources[name] for name in object_names}
+
+def _scan_existing_paths(abs_paths: List[str]) -> set:
+    """
+    Ein os.scandir pro Verzeichnis statt eines stat-Aufrufs pro Datei.
+    Liefert die (Verzeichnis, Name)-Paare aller vorhandenen Einträge dieser Verzeichnisse.
+    """
+    existing = set()
+    for directory in {os.path.dirname(p) for p in abs_paths}:
+        try:
+            with os.scandir(directory) as entries:
+                existing.update((directory, entry.name) for entry in entries)
+        except OSError: # Verzeichnis fehlt/nicht lesbar: alle Dateien darin gelten als nicht vorhanden
+            pass
+    return existing
+
+def _path_in_scan(abs_path: str, existing: set) -> bool:
+    return (os.path.dirname(abs_path), os.path.basename(abs_path)) in existing
+
+def _load_json_entry(file_path_rel_to_project: str, use_cache: bool = True, exists: bool = True) -> Any:
+    """Lädt eine JSON5-Datei für den Kontext; Fehler werden als "FEHLER: ..."-String zurückgegeben."""
+    abs_file_path = os.path.join(PROJECT_ROOT, file_path_rel_to_project)
+    try: # exists kommt aus dem Verzeichnis-Scan; FileNotFoundError aus stat/open wird trotzdem behandelt
+        if not exists: raise FileNotFoundError(abs_file_path)
+        data = load_json_file_cached(abs_file_path, use_cache)
+        logger.debug(f"ContextExtractor: Inhalt von '{abs_file_path}' geladen.")
+        return data
+    except FileNotFoundError:
+        logger.warning(f"ContextExtractor: JSON5-Datei nicht gefunden: '{abs_file_path}'")
+        return "FEHLER: Datei nicht gefunden."
+    except Exception as e:
+        logger.error(f"ContextExtractor: Fehler beim Laden von JSON5 '{abs_file_path}': {e}")
+        return f"FEHLER: Konnte Datei nicht laden - {e}"
+
+def _load_full_content_entry(file_path_rel_to_project_or_abs: str, exists: bool = True) -> str:
+    """Liest eine Datei vollständig als Text; Fehler werden als "FEHLER: ..."-String zurückgegeben."""
+    abs_file_path_full = os.path.join(PROJECT_ROOT, file_path_rel_to_project_or_abs) # join lässt absolute Pfade unverändert
+    try:
+        if not exists: raise FileNotFoundError(abs_file_path_full)
+        with open(abs_file_path_full, 'rb') as f_full: # Ein read() der Bytes, einmal dekodieren (kein TextIOWrapper)
+            content = f_full.read().decode('utf-8', errors='replace')
+        logger.debug(f"ContextExtractor: Vollständiger Inhalt von '{abs_file_path_full}' geladen.")
+        return content
+    except FileNotFoundError:
+        logger.warning(f"ContextExtractor: Datei für vollen Inhalt nicht gefunden: '{abs_file_path_full}'")
+        return "FEHLER: Datei nicht gefunden."
+    except Exception as e:
+        logger.error(f"ContextExtractor: Fehler beim Laden von '{abs_file_path_full}': {e}")
+        return f"FEHLER: Konnte Datei nicht laden - {e}"
+
+_ITEM_KEY = operator.itemgetter(0)
+_BACKTICK_TRANS = str.maketrans({'`': None}) # Entfernt Backticks aus Werten (C-Implementierung statt .replace)
+
+def _iter_markdown_items(data: Union[Dict, List], sort_keys: bool = False):
+    """Liefert die (Schlüssel/Index, Wert)-Paare in der Ausgabereihenfolge (Dicts in Einfügereihenfolge oder nach Schlüssel sortiert)."""
+    if not isinstance(data, dict):
+        return enumerate(data)
+    if not sort_keys: # Dicts behalten die Reihenfolge aus der Quelldatei, kein O(n log n) pro Ebene
+        return iter(data.items())
+    try:
+        # Nur nach Schlüsseln sortieren, nicht nach ganzen (Schlüssel, Wert)-Tupeln
+        return iter(sorted(data.items(), key=_ITEM_KEY))
+    except TypeError: # Gemischte, nicht vergleichbare Schlüsseltypen: Einfügereihenfolge beibehalten
+        return iter(list(data.items()))
+
+def write_data_as_markdown(data: Union[Dict, List], write, indent_level: int = 0, sort_keys: bool = False) -> None:
+    """
+    Schreibt verschachtelte Dicts/Listen als Markdown-Aufzählung direkt über write(str).
+    Iterativ mit explizitem Stack statt Rekursion; Zeilen werden durch "\n" getrennt (kein abschließender Umbruch).
+    Leere verschachtelte Container erzeugen (wie bisher) eine Leerzeile.
+    Mit sort_keys=True werden Dict-Schlüssel sortiert ausgegeben, sonst in Einfügereihenfolge.
+    """
+    def make_frame(items, is_list: bool, indent: str):
+        # Präfixe einmal pro Container vorberechnen statt "  " * level und f-Strings pro Zeile
+        # (Iterator, Container ist Liste, Zeilenpräfix, Präfix der Listen-Zeile, Einrückung der Kindebene)
+        return (items, is_list, indent + "* **", indent + "  * `", indent + "  ")
+
+    stack = [make_frame(_iter_markdown_items(data, sort_keys), isinstance(data, list), "  " * indent_level)]
+    separator = "" # Vor der ersten Zeile kein Umbruch
+    while stack:
+        items, is_list, bullet, list_prefix, child_indent = stack[-1]
+        entry = next(items, None)
+        if entry is None:
+            stack.pop()
+            continue
+        key_or_idx, value = entry
+        write(separator); separator = "\n"
+        write(bullet); write(f"[{key_or_idx}]" if is_list else str(key_or_idx))
 
-    for key_or_idx, value in items_to_iterate:
-        display_key = f"[{key_or_idx}]" if isinstance(data, list) else str(key_or_idx)
-        
         if isinstance(value, dict):
-            lines.append(f"{indent_str}* **{display_key}:**")
-            lines.append(format_data_for_markdown(value, indent_level + 1))
+            write(":**")
+            if value: stack.append(make_frame(_iter_markdown_items(value, sort_keys), False, child_indent))
+            else: write("\n") # Leere Zeile für leere Dicts
         elif isinstance(value, list):
-            lines.append(f"{indent_str}* **{display_key}:**")
+            write(":**")
             if not value or all(not isinstance(item, (dict, list)) for item in value):
-                lines.append(f"{indent_str}  * `{[str(v).replace('`', '') for v in value]}`") # Backticks in Strings escapen/entfernen
-            else: 
-                for i, item in enumerate(value): # Verschachtelte Listen/Dicts in Listen
-                    # Zeige Index für Listenelemente
-                    lines.append(format_data_for_markdown({f"Item {i}": item}, indent_level + 1))
+                write("\n"); write(list_prefix)
+                write(str([(v if type(v) is str else str(v)).translate(_BACKTICK_TRANS) for v in value])) # Backticks in Strings escapen/entfernen
+                write("`")
+            else: # Verschachtelte Listen/Dicts in Listen, Elemente als "Item i" eine Ebene tiefer
+                stack.append(make_frame(((f"Item {i}", item) for i, item in enumerate(value)), False, child_indent))
         else:
-            lines.append(f"{indent_str}* **{display_key}:** `{str(value).replace('`', '')}`")
-    return "\n".join(lines)
+            write(":** `"); write((value if type(value) is str else str(value)).translate(_BACKTICK_TRANS)); write("`")
+
+def format_data_for_markdown(data: Union[Dict, List], indent_level: int = 0, sort_keys: bool = False) -> str: # Umbenannt für Klarheit
+    """Wie write_data_as_markdown, gibt das Ergebnis aber als String zurück."""
+    parts: List[str] = []
+    write_data_as_markdown(data, parts.append, indent_level, sort_keys)
+    return "".join(parts)
+
+# Statische Markdown-Fragmente einmalig als UTF-8-Bytes (Ausgabedatei wird binär geschrieben)
+_B_SEPARATOR = ("=" * 40 + "\n\n").encode('utf-8')
+_B_BLANK_LINES = b"\n\n"
+_B_SECTION_JSON = "## 1. JSON-basierte Konfigurationen und Daten\n\n".encode('utf-8')
+_B_NO_JSON = "Keine JSON-Dateien extrahiert.\n".encode('utf-8')
+_B_SECTION_FULL_FILES = "## 2. Vollständige Dateiinhalte (z.B. verwendete RL-Setup-Datei)\n\n".encode('utf-8')
+_B_NO_FULL_FILES = "Keine Dateien für vollständigen Inhalt angegeben oder gefunden.\n\n".encode('utf-8')
+_B_SECTION_SNIPPETS = ("## 3. Relevante Code Snippets\n" + "=" * 28 + "\n").encode('utf-8')
+_B_NO_SOURCE = "*Quelle nicht verfügbar oder leer.*\n\n".encode('utf-8')
+_B_FOOTER = ("\n" + "=" * 40 + "\nEnde des extrahierten Kontexts.\n").encode('utf-8')
+
+# Wiederkehrende Markdown-Vorlagen (gebundene str.format-Methoden, einmalig auf Modulebene)
+_FILE_HEADER = "### Datei: `{filename}`\n\n".format
+_MODULE_HEADER = "\n--- Modul: `{module_path}` ---\n".format
+_OBJ_HEADER = "\n### Objekt: `{module_path}.{object_name}`\n\n".format
+_PLAIN_BLOCK = "```\n{content}\n```\n\n".format
+_CODE_BLOCK = "```{lang}\n{content}\n```\n\n".format
+
+def _compute_context_cache_key(
+    run_identifier: str,
+    json_files: List[str],
+    code_snippets: Dict[str, List[str]],
+    full_content_files: List[str]
+    ) -> str:
+    """
+    Bildet einen Cache-Schlüssel aus Lauf-ID, Extraktions-Konfiguration sowie Pfad, mtime und Größe
+    aller Eingabedateien und Quellmodule (ohne die Module zu importieren).
+    """
+    key = hashlib.blake2b(digest_size=16)
+    key.update(repr((run_identifier, list(json_files), sorted((m, list(o)) for m, o in code_snippets.items()),
+                     list(full_content_files))).encode('utf-8'))
+
+    paths = [os.path.join(PROJECT_ROOT, p) for p in json_files] # join lässt absolute Pfade unverändert
+    paths.extend(os.path.join(PROJECT_ROOT, p) for p in full_content_files)
+    for module_path in code_snippets:
+        try:
+            spec = importlib.util.find_spec(module_path)
+        except (ImportError, ValueError):
+            spec = None
+        paths.append(spec.origin if spec and spec.origin else f"<kein Modul: {module_path}>")
+    paths.append(os.path.abspath(__file__)) # Änderungen am Extractor selbst invalidieren den Cache
+
+    for path in paths:
+        key.update(path.encode('utf-8'))
+        try:
+            st = os.stat(path)
+            key.update(struct.pack("<dq", st.st_mtime, st.st_size))
+        except OSError:
+            key.update(b"<fehlt>")
+    return key.hexdigest()
+
+def _refresh_extraction_timestamp(output_filepath: str, timestamp: str) -> None:
+    """Setzt bei wiederverwendeter Ausgabe die Kopfzeile "Extrahiert am:" auf den aktuellen Zeitpunkt."""
+    with open(output_filepath, 'rb') as f:
+        content = f.read()
+    title_line, sep, rest = content.partition(b"\n")
+    old_line, sep_rest, body = rest.partition(b"\n")
+    if not old_line.startswith(b"Extrahiert am: "):
+        return # Unerwartetes Format: Datei unverändert lassen
+    with open(output_filepath, 'wb') as f:
+        f.write(title_line + sep + f"Extrahiert am: {timestamp}".encode('utf-8') + sep_rest + body)
 
 def extract_and_save_context(
     run_identifier: str, # Umbenannt von run_timestamp_or_name für Klarheit
     output_filepath: str,
     additional_full_content_files: Optional[List[str]] = None,
     json_files_to_extract_override: Optional[List[str]] = None,
-    code_snippets_to_extract_override: Optional[Dict[str, List[str]]] = None
+    code_snippets_to_extract_override: Optional[Dict[str, List[str]]] = None,
+    use_cache: bool = True
     ) -> Optional[str]:
     
     logger.info(f"ContextExtractor: Extrahiere Kontext für Lauf '{run_identifier}' nach: {output_filepath}")
@@ -120,98 +452,103 @@ def extract_and_save_context(
     if additional_full_content_files:
         full_content_files_to_process.extend(additional_full_content_files)
 
-    # 1. Lade JSON5-Dateien
-    context_data["json_configurations"] = {} # Umbenannt für bessere Gruppierung
-    for file_path_rel_to_project in json_files:
-        abs_file_path = os.path.join(PROJECT_ROOT, file_path_rel_to_project)
-        file_key = file_path_rel_to_project.replace(os.sep, "_") # Eindeutiger Schlüssel aus Pfad
-        
-        if os.path.exists(abs_file_path):
-            try:
-                with open(abs_file_path, 'r', encoding='utf-8') as f:
-                    context_data["json_configurations"][file_key] = json5.load(f)
-                logger.debug(f"ContextExtractor: Inhalt von '{abs_file_path}' geladen.")
-            except Exception as e:
-                logger.error(f"ContextExtractor: Fehler beim Laden von JSON5 '{abs_file_path}': {e}")
-                context_data["json_configurations"][file_key] = f"FEHLER: Konnte Datei nicht laden - {e}"
-        else:
-            logger.warning(f"ContextExtractor: JSON5-Datei nicht gefunden: '{abs_file_path}'")
-            context_data["json_configurations"][file_key] = "FEHLER: Datei nicht gefunden."
+    # Unveränderte Eingaben: vorhandene Ausgabe wiederverwenden statt alles neu zu importieren/parsen
+    cache_key = _compute_context_cache_key(run_identifier, json_files, code_snippets, full_content_files_to_process)
+    hash_filepath = output_filepath + ".hash"
+    if use_cache and os.path.exists(output_filepath):
+        try:
+            with open(hash_filepath, 'r', encoding='utf-8') as f_hash:
+                cache_hit = f_hash.read().strip() == cache_key
+            if cache_hit:
+                logger.info(f"ContextExtractor: Eingaben unverändert, verwende vorhandene Ausgabe '{output_filepath}'.")
+                _refresh_extraction_timestamp(output_filepath, context_data['meta']['extraction_timestamp'])
+                return output_filepath
+        except OSError:
+            pass # Keine (lesbare) Hash- oder Ausgabedatei: normal extrahieren
+
+    # 1.-3. JSON5-Dateien laden, Code-Snippets extrahieren, ganze Dateiinhalte lesen.
+    # Datei-I/O und JSON-Parsing laufen parallel im Thread-Pool. Die Snippets brauchen Modul-Importe und
+    # werden deshalb währenddessen nacheinander im Haupt-Thread extrahiert (keine Importe aus Worker-Threads).
+    # Das Einsortieren in context_data passiert danach in der ursprünglichen Reihenfolge.
+    existing_paths = _scan_existing_paths([os.path.join(PROJECT_ROOT, p) for p in (*json_files, *full_content_files_to_process)])
+    with ThreadPoolExecutor(max_workers=_EXTRACTOR_MAX_WORKERS) as executor:
+        json_futures = [(file_path_rel_to_project.replace(os.sep, "_"), # Eindeutiger Schlüssel aus Pfad
+                         executor.submit(_load_json_entry, file_path_rel_to_project, use_cache,
+                                         _path_in_scan(os.path.join(PROJECT_ROOT, file_path_rel_to_project), existing_paths)))
+                        for file_path_rel_to_project in json_files]
+        full_content_futures = [(os.path.basename(os.path.join(PROJECT_ROOT, file_path)), # Nur Dateiname als Schlüssel
+                                 executor.submit(_load_full_content_entry, file_path,
+                                                 _path_in_scan(os.path.join(PROJECT_ROOT, file_path), existing_paths)))
+                                for file_path in full_content_files_to_process]
+        snippet_results = [(module_path, extract_module_snippets(module_path, object_names, use_cache)) # Ein Import pro Modul
+                           for module_path, object_names in code_snippets.items()]
+
+    context_data["json_configurations"] = {file_key: future.result() for file_key, future in json_futures} # Umbenannt für bessere Gruppierung
 
-    # 2. Extrahiere Code-Snippets
     context_data["code_snippets"] = {}
-    for module_path, object_names in code_snippets.items():
-        context_data["code_snippets"][module_path] = {}
-        for object_name in object_names:
-            source = get_source_code(module_path, object_name)
-            context_data["code_snippets"][module_path][object_name] = source if source else "FEHLER: Quelle nicht extrahierbar."
+    for module_path, snippets in snippet_results:
+        context_data["code_snippets"][module_path] = {object_name: source if source else "FEHLER: Quelle nicht extrahierbar."
+                                                      for object_name, source in snippets.items()}
 
-    # 3. Füge ganze Dateiinhalte hinzu
     context_data["full_file_contents"] = {}
-    for file_path_rel_to_project_or_abs in full_content_files_to_process:
-        abs_file_path_full = file_path_rel_to_project_or_abs
-        if not os.path.isabs(file_path_rel_to_project_or_abs):
-            abs_file_path_full = os.path.join(PROJECT_ROOT, file_path_rel_to_project_or_abs)
-        
-        file_key_full = os.path.basename(abs_file_path_full) # Nur Dateiname als Schlüssel
-        # Um Duplikate zu vermeiden, wenn der gleiche Dateiname aus verschiedenen Pfaden kommt:
-        # file_key_full = file_path_rel_to_project_or_abs.replace(os.sep, "_") # Ganzer relativer Pfad als Key
-
-        if os.path.exists(abs_file_path_full):
-            try:
-                with open(abs_file_path_full, 'r', encoding='utf-8') as f_full:
-                    context_data["full_file_contents"][file_key_full] = f_full.read()
-                logger.debug(f"ContextExtractor: Vollständiger Inhalt von '{abs_file_path_full}' geladen.")
-            except Exception as e:
-                logger.error(f"ContextExtractor: Fehler beim Laden von '{abs_file_path_full}': {e}")
-                context_data["full_file_contents"][file_key_full] = f"FEHLER: Konnte Datei nicht laden - {e}"
-        else:
-            logger.warning(f"ContextExtractor: Datei für vollen Inhalt nicht gefunden: '{abs_file_path_full}'")
-            context_data["full_file_contents"][file_key_full] = "FEHLER: Datei nicht gefunden."
+    for file_key_full, future in full_content_futures:
+        # Um Duplikate zu vermeiden, wenn der gleiche Dateiname aus verschiedenen Pfaden kommt,
+        # könnte stattdessen der ganze relative Pfad als Key dienen.
+        context_data["full_file_contents"][file_key_full] = future.result()
 
     # Schreibe die gesammelten Daten in die Markdown-Datei
     try:
         os.makedirs(os.path.dirname(output_filepath), exist_ok=True)
-        with open(output_filepath, 'w', encoding='utf-8') as outfile:
-            outfile.write(f"# RPG Projekt Kontext - Lauf: {run_identifier}\n")
-            outfile.write(f"Extrahiert am: {context_data['meta']['extraction_timestamp']}\n")
-            outfile.write("=" * 40 + "\n\n")
-
-            outfile.write("## 1. JSON-basierte Konfigurationen und Daten\n\n")
-            if context_data["json_configurations"]:
-                outfile.write(format_data_for_markdown(context_data["json_configurations"], indent_level=0))
-            else:
-                outfile.write("Keine JSON-Dateien extrahiert.\n")
-            outfile.write("\n\n")
-            
-            outfile.write("## 2. Vollständige Dateiinhalte (z.B. verwendete RL-Setup-Datei)\n\n")
-            if context_data["full_file_contents"]:
-                for filename, content in context_data["full_file_contents"].items():
-                    outfile.write(f"### Datei: `{filename}`\n\n")
-                    if isinstance(content, str) and content.startswith("FEHLER:"):
-                        outfile.write(f"```\n{content}\n```\n\n")
-                    else:
-                        lang_hint = "json5" if filename.endswith((".json5", ".json")) else \
-                                    "python" if filename.endswith(".py") else \
-                                    "markdown" if filename.endswith(".md") else ""
-                        outfile.write(f"```{lang_hint}\n{content}\n```\n\n")
-            else:
-                outfile.write("Keine Dateien für vollständigen Inhalt angegeben oder gefunden.\n\n")
-
-            outfile.write("## 3. Relevante Code Snippets\n")
-            outfile.write("=" * 28 + "\n")
-            for module_path, objects in context_data["code_snippets"].items():
-                outfile.write(f"\n--- Modul: `{module_path}` ---\n")
-                for object_name, source_code in objects.items():
-                    outfile.write(f"\n### Objekt: `{module_path}.{object_name}`\n\n")
-                    if source_code and source_code.startswith("FEHLER:"):
-                        outfile.write(f"```\n{source_code}\n```\n\n")
-                    elif source_code:
-                        outfile.write(f"```python\n{source_code.strip()}\n```\n\n")
-                    else:
-                        outfile.write(f"*Quelle nicht verfügbar oder leer.*\n\n")
-            
-            outfile.write("\n" + "=" * 40 + "\nEnde des extrahierten Kontexts.\n")
+        # Alle Fragmente sammeln und mit einem einzigen write() in die Datei schreiben
+        parts: List[bytes] = []
+        write = parts.append
+        def write_text(text: str) -> None:
+            write(text.encode('utf-8'))
+
+        write_text(f"# RPG Projekt Kontext - Lauf: {run_identifier}\n")
+        write_text(f"Extrahiert am: {context_data['meta']['extraction_timestamp']}\n")
+        write(_B_SEPARATOR)
+
+        write(_B_SECTION_JSON)
+        if context_data["json_configurations"]:
+            write_text(format_data_for_markdown(context_data["json_configurations"], indent_level=0))
+        else:
+            write(_B_NO_JSON)
+        write(_B_BLANK_LINES)
+        
+        write(_B_SECTION_FULL_FILES)
+        if context_data["full_file_contents"]:
+            for filename, content in context_data["full_file_contents"].items():
+                write_text(_FILE_HEADER(filename=filename))
+                if isinstance(content, str) and content.startswith("FEHLER:"):
+                    write_text(_PLAIN_BLOCK(content=content))
+                else:
+                    lang_hint = "json5" if filename.endswith((".json5", ".json")) else \
+                                "python" if filename.endswith(".py") else \
+                                "markdown" if filename.endswith(".md") else ""
+                    write_text(_CODE_BLOCK(lang=lang_hint, content=content))
+        else:
+            write(_B_NO_FULL_FILES)
+
+        write(_B_SECTION_SNIPPETS)
+        for module_path, objects in context_data["code_snippets"].items():
+            write_text(_MODULE_HEADER(module_path=module_path))
+            for object_name, source_code in objects.items():
+                write_text(_OBJ_HEADER(module_path=module_path, object_name=object_name))
+                if source_code and source_code.startswith("FEHLER:"):
+                    write_text(_PLAIN_BLOCK(content=source_code))
+                elif source_code:
+                    write_text(_CODE_BLOCK(lang="python", content=source_code.strip()))
+                else:
+                    write(_B_NO_SOURCE)
+        
+        write(_B_FOOTER)
+
+        with open(output_filepath, 'wb') as outfile:
+            outfile.write(b"".join(parts))
+
+        with open(hash_filepath, 'w', encoding='utf-8') as f_hash:
+            f_hash.write(cache_key)
         
         logger.info(f"ContextExtractor: Kontext-Extraktion nach '{output_filepath}' abgeschlossen.")
         return output_filepath
@@ -235,7 +572,8 @@ if __name__ == '__main__':
     dummy_rl_config_path_abs = os.path.join(PROJECT_ROOT, dummy_rl_config_path_rel)
     os.makedirs(os.path.dirname(dummy_rl_config_path_abs), exist_ok=True)
     with open(dummy_rl_config_path_abs, 'w', encoding='utf-8') as f_dummy:
-        json5.dump({"test_param": "extractor_test_value", "description": "Dummy RL Config für Extractor Test"}, f_dummy, indent=2)
+        # Dummy enthält keine JSON5-Syntax: json statt json5 (kein json5-Import im Testlauf nötig)
+        f_dummy.write(json.dumps({"test_param": "extractor_test_value", "description": "Dummy RL Config für Extractor Test"}, indent=2))
 
     # Wichtig: Pfade für additional_full_content_files sollten relativ zum Projekt-Root sein,
     # da der Extractor sie so erwartet, wenn sie in _FILES_TO_INCLUDE_FULL_CONTENT_CONFIG wären.
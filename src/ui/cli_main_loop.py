@@ -3,9 +3,15 @@
 Steuert die automatische Simulationsschleife für Kämpfe im CLI-Modus.
 Nutzt die KI, Kampflogik und CLI-Ausgaben.
 """
+import os
+import io
 import time
 import logging
 import random
+import contextlib
+import concurrent.futures
+import logging.handlers
+import multiprocessing
 from typing import List, Optional, Tuple, Dict, Any 
 
 from src.game_logic.entities import CharacterInstance
@@ -22,6 +28,26 @@ logger = logging.getLogger(__name__)
 SIMULATION_DELAY_BETWEEN_TURNS = 0.7  # Etwas schneller für Tests
 SIMULATION_DELAY_BETWEEN_ACTIONS = 0.3 
 MAX_COMBAT_ROUNDS = 50 
+# Faktor für alle Pausen der Simulation: 1.0 = interaktives Zuschauen, 0 = keine Pausen (z.B. Batch-/RL-Läufe).
+# Mit der Umgebungsvariable RPG_FAST_UI=1 sind die Pausen von Anfang an deaktiviert.
+SIMULATION_PAUSE_FACTOR = 0.0 if os.environ.get("RPG_FAST_UI") == "1" else 1.0
+
+def set_simulation_pause_factor(factor: float) -> None:
+    """Setzt den globalen Pausenfaktor der Simulation (0 deaktiviert alle time.sleep-Aufrufe)."""
+    global SIMULATION_PAUSE_FACTOR
+    SIMULATION_PAUSE_FACTOR = max(0.0, float(factor))
+
+def _pause(seconds: float) -> None:
+    """Pausiert die Simulation um seconds * SIMULATION_PAUSE_FACTOR; bei Faktor 0 kein Aufruf von time.sleep."""
+    if SIMULATION_PAUSE_FACTOR:
+        time.sleep(seconds * SIMULATION_PAUSE_FACTOR)
+
+def _hp_ratio(character: CharacterInstance) -> float:
+    """HP-Anteil für die Zielauswahl (Charaktere ohne max_hp zählen als unverwundbar)."""
+    return character.current_hp / character.max_hp if character.max_hp > 0 else float('inf')
+
+# Kopfzeile zu Kampfbeginn, einmalig vorformatiert
+_COMBAT_START_HEADER = cli_output.format_message("\n" + "="*10 + " KAMPF BEGINNT " + "="*10, cli_output.Colors.BOLD_YELLOW)
 
 try:
     SKILL_DEFINITIONS_CLI: Dict[str, SkillTemplate] = load_skill_templates()
@@ -30,22 +56,71 @@ except Exception as e:
     SKILL_DEFINITIONS_CLI = {}
 
 class CLISimulationLoop:
-    def __init__(self):
+    def __init__(self, status_display_interval: int = 1,
+                 character_templates: Optional[Dict[str, CharacterTemplate]] = None,
+                 opponent_templates: Optional[Dict[str, OpponentTemplate]] = None,
+                 fast_mode: bool = False,
+                 status_changes_only: bool = False):
+        """
+        status_display_interval: Der Team-Status am Rundenende wird nur jede N-te Runde ausgegeben
+                                 (1 = jede Runde; größere Werte für automatische Läufe ohne Zuschauer).
+        character_templates / opponent_templates: Optional bereits geladene Templates (z.B. von einem
+                                 Batch-Runner, der viele Schleifen erzeugt); sonst lädt der Loader sie beim ersten Zugriff.
+        fast_mode: Batch-/Headless-Betrieb ohne jede Pause, unabhängig vom globalen Pausenfaktor.
+        status_changes_only: Im Team-Status nur Mitglieder ausgeben, deren Statuszeile sich seit der letzten
+                                 Ausgabe geändert hat (Teams ohne Änderung entfallen ganz).
+        """
         self.combat_handler = CombatHandler()
-        self.character_templates: Dict[str, CharacterTemplate] = {}
-        self.opponent_templates: Dict[str, OpponentTemplate] = {}
-        self._load_definitions()
-
-    def _load_definitions(self):
+        self.status_display_interval = max(1, int(status_display_interval))
+        self.fast_mode = fast_mode
+        self.status_changes_only = status_changes_only
+        # Zuletzt ausgegebene Statuszeile je Instanz (id) für status_changes_only; pro Begegnung geleert
+        self._last_status_by_id: Dict[int, Tuple[tuple, str]] = {}
+        # Templates werden erst beim ersten Zugriff geladen (siehe Properties unten), sofern nicht übergeben
+        self._character_templates: Optional[Dict[str, CharacterTemplate]] = character_templates
+        self._opponent_templates: Optional[Dict[str, OpponentTemplate]] = opponent_templates
+        # Caches pro Instanz, da sie von den Gegner-Templates dieser Schleife abhängen (siehe _load_definitions).
+        # Pro Gegner-Template einmal erstellte Prototyp-Instanz; Gegner werden davon geklont
+        self._opponent_prototypes: Dict[str, CharacterInstance] = {}
+        # Level-Pool-String -> passende Gegner-Templates (unveränderliches Tupel), einmal pro Pool berechnet
+        self._eligible_opponents_cache: Dict[str, Tuple[OpponentTemplate, ...]] = {}
+
+    @property
+    def character_templates(self) -> Dict[str, CharacterTemplate]:
+        if self._character_templates is None:
+            self._load_definitions(only_missing=True)
+        return self._character_templates
+
+    @property
+    def opponent_templates(self) -> Dict[str, OpponentTemplate]:
+        if self._opponent_templates is None:
+            self._load_definitions(only_missing=True)
+        return self._opponent_templates
+
+    def _wait(self, seconds: float) -> None:
+        """Pause zwischen Zügen/Runden; im fast_mode entfällt sie ganz."""
+        if not self.fast_mode:
+            _pause(seconds)
+
+    def _load_definitions(self, only_missing: bool = False):
+        """Lädt die Templates; mit only_missing bleiben bereits gesetzte (z.B. übergebene) Templates erhalten."""
+        # Neue Templates machen abgeleitete Caches ungültig
+        self._opponent_prototypes.clear()
+        self._eligible_opponents_cache.clear()
         try:
-            self.character_templates = load_character_templates()
-            self.opponent_templates = load_opponent_templates()
-            if not self.character_templates or not self.opponent_templates:
+            if not only_missing or self._character_templates is None:
+                self._character_templates = load_character_templates()
+            if not only_missing or self._opponent_templates is None:
+                self._opponent_templates = load_opponent_templates()
+            if not self._character_templates or not self._opponent_templates:
                  logger.warning("Einige oder alle Charakter/Gegner-Templates konnten nicht geladen werden.")
             else:
                  logger.info("Charakter- und Gegner-Templates für die Simulation geladen.")
         except Exception as e:
             logger.critical(f"Fehler beim Laden der Definitionen für die Simulation: {e}", exc_info=True)
+        # Fehlgeschlagenes Laden nicht bei jedem Zugriff wiederholen; _load_definitions_if_empty lädt gezielt nach
+        if self._character_templates is None: self._character_templates = {}
+        if self._opponent_templates is None: self._opponent_templates = {}
 
     def _create_player_team(self, player_ids: List[str]) -> List[CharacterInstance]:
         team: List[CharacterInstance] = []
@@ -60,17 +135,19 @@ class CLISimulationLoop:
                 if len(player_ids) > 1 : # Mehrere Spieler im Team
                      name_override = f"{template.name} {i+1}"
                 instance = CharacterInstance(base_template=template, name_override=name_override)
+                instance.prepare_skill_cache(SKILL_DEFINITIONS_CLI)
                 team.append(instance)
             else:
                 logger.error(f"Spieler-Template mit ID '{player_id}' nicht gefunden. Kann nicht erstellt werden.")
         return team
 
-    def _create_opponent_team(self, opponent_config: Dict[str, Any]) -> List[CharacterInstance]:
-        team: List[CharacterInstance] = []
-        num_opponents = opponent_config.get("num_opponents", 1)
-        level_pool_str = str(opponent_config.get("level_pool", "1-2")).lower() # Sicherstellen, dass es ein String ist
-        
-        eligible_opponents: List[OpponentTemplate] = []
+    def _get_eligible_opponents(self, level_pool_str: str) -> Tuple[OpponentTemplate, ...]:
+        """Gibt die Gegner-Templates für einen Level-Pool (z.B. "1-3" oder "all") zurück; Ergebnis wird pro Pool gecacht."""
+        cached = self._eligible_opponents_cache.get(level_pool_str)
+        if cached is not None:
+            return cached
+
+        pool_key = level_pool_str
         min_lvl, max_lvl = -1, -1
 
         if level_pool_str != "all":
@@ -79,44 +156,104 @@ class CLISimulationLoop:
                 min_lvl = int(parts[0])
                 max_lvl = int(parts[1]) if len(parts) > 1 else min_lvl
             except (ValueError, IndexError):
-                logger.warning(f"Ungültiger Level-Pool String: '{level_pool_str}'. Verwende alle Gegner.")
+                logger.warning("Ungültiger Level-Pool String: '%s'. Verwende alle Gegner.", level_pool_str)
                 level_pool_str = "all" 
 
         if not self.opponent_templates: # Sicherstellen, dass Templates geladen sind
             logger.error("Keine Gegner-Templates geladen. Gegnerteam kann nicht erstellt werden.")
-            return []
+            return ()
 
+        eligible_opponents: List[OpponentTemplate] = []
         for opp_template in self.opponent_templates.values():
             if level_pool_str == "all":
                 eligible_opponents.append(opp_template)
-            elif hasattr(opp_template, 'level') and min_lvl <= opp_template.level <= max_lvl:
+            elif min_lvl <= opp_template.level <= max_lvl: # OpponentTemplate hat immer ein level
                 eligible_opponents.append(opp_template)
         
         if not eligible_opponents:
-            logger.warning(f"Keine Gegner im Level-Pool '{level_pool_str}' gefunden. Versuche Fallback auf 'goblin_lv1'.")
+            logger.warning("Keine Gegner im Level-Pool '%s' gefunden. Versuche Fallback auf 'goblin_lv1'.", level_pool_str)
             gob_template = self.opponent_templates.get("goblin_lv1")
             if gob_template:
                 eligible_opponents = [gob_template] 
             if not eligible_opponents:
                  logger.error("Fallback-Gegner 'goblin_lv1' nicht gefunden. Gegnerteam kann nicht erstellt werden.")
-                 return []
-
-        for i in range(num_opponents):
-            if not eligible_opponents: 
-                logger.warning(f"Nicht genügend unterschiedliche Gegner im Pool, um {num_opponents} zu erstellen. Erstellt: {len(team)}")
-                break
-            chosen_template = random.choice(eligible_opponents)
-            instance = CharacterInstance(base_template=chosen_template, name_override=f"{chosen_template.name} #{i+1}")
+                 return ()
+
+        result = tuple(eligible_opponents)
+        self._eligible_opponents_cache[pool_key] = result
+        return result
+
+    def _create_opponent_team(self, opponent_config: Dict[str, Any]) -> List[CharacterInstance]:
+        team: List[CharacterInstance] = []
+        num_opponents = opponent_config.get("num_opponents", 1)
+        level_pool_str = str(opponent_config.get("level_pool", "1-2")).lower() # Sicherstellen, dass es ein String ist
+        
+        eligible_opponents = self._get_eligible_opponents(level_pool_str)
+        if not eligible_opponents:
+            return []
+
+        # Alle Gegner-Templates mit einem Aufruf ziehen (mit Zurücklegen, wie zuvor die Einzelziehungen)
+        chosen_templates = random.choices(eligible_opponents, k=max(0, num_opponents))
+        for i, chosen_template in enumerate(chosen_templates):
+            prototype = self._opponent_prototypes.get(chosen_template.id)
+            if prototype is None:
+                prototype = CharacterInstance(base_template=chosen_template)
+                prototype.prepare_skill_cache(SKILL_DEFINITIONS_CLI) # Klone übernehmen die Skill-Filter
+                self._opponent_prototypes[chosen_template.id] = prototype
+            instance = prototype.clone(name_override=f"{chosen_template.name} #{i+1}")
             team.append(instance)
             
         return team
 
-    def _display_team_status(self, team: List[CharacterInstance], team_name: str, is_player_team: bool):
-        cli_output.print_message(f"\n--- Status {team_name} ---", bold=True)
+    def _format_changed_team_status(self, team: List[CharacterInstance], is_player_team: bool, title: str) -> str:
+        """
+        Wie cli_output.format_team_status, aber nur mit Mitgliedern, deren Statuszeile sich geändert hat.
+        Mitglieder mit unveränderten Werten werden über ein billiges Werte-Tupel übersprungen, ohne die Zeile zu
+        formatieren; bei aktiven Effekten wird immer formatiert, da sich deren Restdauer ohne Wertänderung ändert.
+        """
+        last_status_by_id = self._last_status_by_id
+        changed_lines = []
         for member in team:
-            cli_output.display_character_status(member, is_player_team=is_player_team)
-
-    def _get_opposing_team(self, current_actor: CharacterInstance, player_team: List[CharacterInstance], opponent_team: List[CharacterInstance]) -> List[CharacterInstance]:
+            status_key = (member.current_hp, member.current_mana, member.current_stamina, member.current_energy,
+                          member.shield_points, len(member.status_effects), member.is_defeated)
+            last = last_status_by_id.get(id(member))
+            if last is not None and last[0] == status_key and not member.status_effects:
+                continue
+            status = cli_output.format_character_status(member, is_player_team)
+            last_status_by_id[id(member)] = (status_key, status)
+            if last is None or last[1] != status:
+                changed_lines.append(status)
+        if not changed_lines:
+            return ""
+        return "\n".join([cli_output.format_message(title, bold=True)] + changed_lines)
+
+    def _display_combat_status(self, player_team: List[CharacterInstance], opponent_team: List[CharacterInstance],
+                               header: Optional[str] = None):
+        """Gibt den Status beider Teams (optional mit Kopfzeile) als einen einzigen Block aus."""
+        format_team = self._format_changed_team_status if self.status_changes_only else cli_output.format_team_status
+        parts = [header] if header else []
+        parts.append(format_team(player_team, True, "\n--- Status Spieler-Team ---"))
+        parts.append(format_team(opponent_team, False, "\n--- Status Gegner-Team ---"))
+        parts = [part for part in parts if part]
+        if parts:
+            print("\n".join(parts))
+
+    def _get_opposing_team(self, current_actor: CharacterInstance, player_team: List[CharacterInstance], opponent_team: List[CharacterInstance],
+                           opposing_team_by_id: Optional[Dict[int, List[CharacterInstance]]] = None,
+                           out: Optional[List[CharacterInstance]] = None) -> List[CharacterInstance]:
+        """
+        Gibt die lebenden Mitglieder des gegnerischen Teams zurück.
+        opposing_team_by_id (id(Instanz) -> gegnerisches Team) erlaubt eine Zuordnung in O(1) statt Listen-Suche.
+        out: Optionale, wiederverwendete Ergebnisliste (wird geleert und neu befüllt statt pro Zug neu angelegt);
+             nur gültig bis zum nächsten Aufruf mit derselben Liste.
+        """
+        if opposing_team_by_id is not None:
+            if out is None:
+                out = []
+            else:
+                out.clear()
+            out.extend(m for m in opposing_team_by_id.get(id(current_actor), ()) if not m.is_defeated)
+            return out
         if current_actor in player_team:
             return [m for m in opponent_team if not m.is_defeated]
         elif current_actor in opponent_team:
@@ -144,79 +281,100 @@ class CLISimulationLoop:
             return None
         
         all_participants = player_team + opponent_team
+        # Gegnerisches Team einmal pro Begegnung über die Objekt-ID zuordnen statt per Listen-Suche in jedem Zug
+        opposing_team_by_id: Dict[int, List[CharacterInstance]] = {id(p): opponent_team for p in player_team}
+        opposing_team_by_id.update({id(o): player_team for o in opponent_team})
+        # NPC (Template mit KI-Strategie) oder Spieler-Auto-KI; einmal pro Begegnung statt hasattr in jedem Zug
+        is_npc_by_id: Dict[int, bool] = {id(c): hasattr(c.base_template, 'ai_strategy_id') for c in all_participants}
+        # KI-Strategie je NPC einmal pro Begegnung erzeugen (Strategien halten nur Akteur und Teilnehmerliste)
+        ai_strategy_by_id: Dict[int, Any] = {}
+        # Zielliste für die KI-Entscheidung; wird in jedem Zug geleert und neu befüllt statt neu angelegt
+        target_scratch: List[CharacterInstance] = []
         round_number = 0
-
-        cli_output.print_message("\n" + "="*10 + " KAMPF BEGINNT " + "="*10, cli_output.Colors.BOLD + cli_output.Colors.YELLOW)
-        self._display_team_status(player_team, "Spieler-Team", True)
-        self._display_team_status(opponent_team, "Gegner-Team", False)
-        time.sleep(SIMULATION_DELAY_BETWEEN_TURNS)
+        # Anzahl lebender Mitglieder je Team; wird nur bei einem Wechsel auf is_defeated verringert statt neu gezählt.
+        # Besiegt werden kann nur der Handelnde (Effekt-Tick, Aktion) oder eines seiner Ziele.
+        players_alive = sum(1 for p in player_team if not p.is_defeated)
+        opponents_alive = sum(1 for o in opponent_team if not o.is_defeated)
+        # XP-Pool je Team steht schon bei Kampfbeginn fest (ausgezahlt wird erst, wenn das ganze Team besiegt ist)
+        player_team_xp = self._team_xp_reward(player_team)
+        opponent_team_xp = self._team_xp_reward(opponent_team)
+        # Pro Aktion genutzte Objekte einmal lokal binden (spart Attribut-/Global-Lookups in der Aktionsschleife)
+        skill_definitions = SKILL_DEFINITIONS_CLI
+        execute_skill_action = self.combat_handler.execute_skill_action
+        # Zugreihenfolge nur neu sortieren, wenn sich eine Initiative geändert hat (z.B. durch Slow/Haste);
+        # besiegte Teilnehmer bleiben in der Liste und werden in der Aktionsschleife übersprungen
+        initiative_order: List[CharacterInstance] = []
+        initiative_key: Optional[Tuple[int, ...]] = None
+
+        # Kopfzeile und Startaufstellung beider Teams als ein Block ausgeben
+        self._last_status_by_id.clear()
+        self._display_combat_status(player_team, opponent_team, header=_COMBAT_START_HEADER)
+        self._wait(SIMULATION_DELAY_BETWEEN_TURNS)
 
         while round_number < MAX_COMBAT_ROUNDS:
             round_number += 1
-            cli_output.display_combat_round_start(round_number)
-            initiative_order = get_initiative_order(all_participants)
-            cli_output.print_message(f"Initiative-Reihenfolge: {', '.join([p.name for p in initiative_order])}", cli_output.Colors.CYAN)
-            time.sleep(SIMULATION_DELAY_BETWEEN_ACTIONS)
+            current_initiative_key = tuple(p.current_initiative for p in all_participants)
+            if current_initiative_key != initiative_key:
+                initiative_order = get_initiative_order(all_participants)
+                initiative_key = current_initiative_key
+            cli_output.display_combat_round_start(round_number, [p.name for p in initiative_order])
+            self._wait(SIMULATION_DELAY_BETWEEN_ACTIONS)
 
             for actor in initiative_order:
                 if actor.is_defeated:
                     continue
-                process_beginning_of_turn_effects(actor)
-                if actor.is_defeated: 
-                    cli_output.print_message(f"{actor.name} wurde durch einen Effekt zu Beginn des Zuges besiegt.", cli_output.Colors.RED)
-                    # Prüfen, ob das der letzte Gegner des anderen Teams war
-                    player_team_alive_after_tick = any(p for p in player_team if not p.is_defeated)
-                    opponent_team_alive_after_tick = any(o for o in opponent_team if not o.is_defeated)
-                    if not player_team_alive_after_tick or not opponent_team_alive_after_tick:
-                        break # Runde beenden, da ein Team komplett besiegt ist
-                    continue 
+                # Ohne aktive Effekte gibt es zu Beginn des Zuges nichts zu ticken (und niemand kann dabei fallen)
+                if actor.has_active_effects:
+                    process_beginning_of_turn_effects(actor)
+                    if actor.is_defeated: 
+                        cli_output.print_message(f"{actor.name} wurde durch einen Effekt zu Beginn des Zuges besiegt.", cli_output.Colors.RED)
+                        if opposing_team_by_id[id(actor)] is opponent_team:
+                            players_alive -= 1
+                        else:
+                            opponents_alive -= 1
+                        # Prüfen, ob das der letzte Kämpfer seines Teams war
+                        if players_alive == 0 or opponents_alive == 0:
+                            break # Runde beenden, da ein Team komplett besiegt ist
+                        continue 
 
                 if not actor.can_act: 
                     cli_output.print_message(f"{actor.name} kann nicht handeln (z.B. betäubt).", cli_output.Colors.YELLOW)
-                    time.sleep(SIMULATION_DELAY_BETWEEN_ACTIONS)
+                    self._wait(SIMULATION_DELAY_BETWEEN_ACTIONS)
                     continue
                 
-                action_decision_list: Optional[Tuple[str, List[CharacterInstance]]] = None 
-                target_list_for_ai = self._get_opposing_team(actor, player_team, opponent_team)
-                is_npc_actor = hasattr(actor.base_template, 'ai_strategy_id')
+                # (Skill-ID, aufgelöstes SkillTemplate oder None, Ziele); das Template wird für die Anzeige weitergereicht
+                action_decision_list: Optional[Tuple[str, Optional[SkillTemplate], List[CharacterInstance]]] = None 
+                target_list_for_ai = self._get_opposing_team(actor, player_team, opponent_team, opposing_team_by_id, target_scratch)
+                is_npc_actor = is_npc_by_id[id(actor)]
 
                 if is_npc_actor:
-                    ai_strategy = get_ai_strategy_instance(actor, all_participants)
+                    actor_key = id(actor)
+                    if actor_key in ai_strategy_by_id:
+                        ai_strategy = ai_strategy_by_id[actor_key]
+                    else:
+                        ai_strategy = ai_strategy_by_id[actor_key] = get_ai_strategy_instance(actor, all_participants)
                     if ai_strategy:
                         decision = ai_strategy.decide_action(target_list_for_ai)
                         if decision:
                             skill_id, target_instance = decision
-                            action_decision_list = (skill_id, [target_instance]) 
+                            action_decision_list = (skill_id, skill_definitions.get(skill_id), [target_instance]) 
                     else: 
-                        logger.warning(f"Keine KI-Strategie für NPC {actor.name} gefunden/instanziiert.")
+                        logger.warning("Keine KI-Strategie für NPC %s gefunden/instanziiert.", actor.name)
                         cli_output.print_message(f"{actor.name} (NPC) findet keine Strategie und führt keine Aktion aus.", cli_output.Colors.YELLOW)
                 else: # Spieler-Charakter (im Auto-Modus)
                     if target_list_for_ai and actor.skills:
-                        chosen_skill_id_player: Optional[str] = None
-                        # Priorisiere offensive Skills
-                        for s_id in actor.skills: 
-                            skill_template = SKILL_DEFINITIONS_CLI.get(s_id)
-                            if skill_template and skill_template.direct_effects and \
-                               (skill_template.direct_effects.base_damage is not None or \
-                                (skill_template.direct_effects.base_damage is None and True)): # True, wenn Waffenschaden
-                                if actor.can_afford_skill(skill_template): 
-                                    chosen_skill_id_player = s_id
-                                    break
-                        if not chosen_skill_id_player: # Wenn kein offensiver, nimm ersten nutzbaren
-                            for s_id in actor.skills:
-                                skill_template = SKILL_DEFINITIONS_CLI.get(s_id)
-                                if skill_template and actor.can_afford_skill(skill_template):
-                                    chosen_skill_id_player = s_id
-                                    break
+                        # Priorisiere offensive Skills (direkte Effekte inkl. Waffenschaden), sonst ersten nutzbaren;
+                        # die Reihenfolge ist pro Instanz vorsortiert, hier wird nur noch die Leistbarkeit geprüft
+                        chosen_skill_id_player = actor.get_preferred_skill_id(skill_definitions)
                         
                         if chosen_skill_id_player:
-                            # Zielauswahl für Spieler-Auto-KI (z.B. zufällig oder schwächstes Ziel)
-                            # Hier: zufälliges Ziel
+                            # Zielauswahl für Spieler-Auto-KI: schwächstes Ziel (niedrigster HP-Anteil, wie BasicMelee);
+                            # ein Durchlauf über die wenigen lebenden Gegner, kein Sortieren und kein Zufallswurf
                             if target_list_for_ai: # Sicherstellen, dass es Ziele gibt
-                                chosen_target_player = random.choice(target_list_for_ai)
-                                action_decision_list = (chosen_skill_id_player, [chosen_target_player])
+                                chosen_target_player = min(target_list_for_ai, key=_hp_ratio)
                                 skill_name_player = chosen_skill_id_player
-                                skill_template_obj = SKILL_DEFINITIONS_CLI.get(chosen_skill_id_player)
+                                skill_template_obj = skill_definitions.get(chosen_skill_id_player)
+                                action_decision_list = (chosen_skill_id_player, skill_template_obj, [chosen_target_player])
                                 if skill_template_obj: 
                                     skill_name_player = skill_template_obj.name
                                 cli_output.print_message(f"{actor.name} (Spieler-Auto-KI) entscheidet: '{skill_name_player}' auf '{chosen_target_player.name}'.", cli_output.Colors.CYAN)
@@ -226,9 +384,8 @@ class CLISimulationLoop:
                             cli_output.print_message(f"{actor.name} (Spieler-Auto-KI) findet keinen nutzbaren Skill.", cli_output.Colors.YELLOW)
 
                 if action_decision_list:
-                    skill_id, targets_for_skill = action_decision_list
+                    skill_id, skill_template_for_display, targets_for_skill = action_decision_list
                     skill_name_to_display = skill_id 
-                    skill_template_for_display = SKILL_DEFINITIONS_CLI.get(skill_id)
                     if skill_template_for_display:
                         skill_name_to_display = skill_template_for_display.name
                     
@@ -237,30 +394,35 @@ class CLISimulationLoop:
                         target_name_display = targets_for_skill[0].name
 
                     cli_output.display_combat_action(actor.name, skill_name_to_display, target_name_display)
-                    self.combat_handler.execute_skill_action(actor, skill_id, targets_for_skill)
+                    at_risk = {id(c): c for c in (actor, *targets_for_skill) if c and not c.is_defeated}
+                    execute_skill_action(actor, skill_id, targets_for_skill)
+                    for char in at_risk.values():
+                        if char.is_defeated:
+                            if opposing_team_by_id[id(char)] is opponent_team:
+                                players_alive -= 1
+                            else:
+                                opponents_alive -= 1
                 else:
                     # Nur für NPCs ausgeben, wenn sie nichts tun (Spieler-Auto-KI loggt schon selbst)
                     if is_npc_actor : 
                         cli_output.print_message(f"{actor.name} führt keine Aktion aus.", cli_output.Colors.YELLOW)
 
-                time.sleep(SIMULATION_DELAY_BETWEEN_ACTIONS)
-                player_team_alive = any(p for p in player_team if not p.is_defeated)
-                opponent_team_alive = any(o for o in opponent_team if not o.is_defeated)
+                self._wait(SIMULATION_DELAY_BETWEEN_ACTIONS)
 
-                if not player_team_alive:
+                if players_alive == 0:
                     cli_output.display_combat_end("Gegner-Team")
-                    self._award_xp(surviving_team=opponent_team, defeated_team=player_team)
+                    self._award_xp(surviving_team=opponent_team, defeated_team=player_team, total_xp_from_defeated_team=player_team_xp)
                     return "Gegner-Team"
-                if not opponent_team_alive:
+                if opponents_alive == 0:
                     cli_output.display_combat_end("Spieler-Team")
-                    self._award_xp(surviving_team=player_team, defeated_team=opponent_team)
+                    self._award_xp(surviving_team=player_team, defeated_team=opponent_team, total_xp_from_defeated_team=opponent_team_xp)
                     return "Spieler-Team"
             
             # Am Ende der Runde den Status anzeigen, wenn der Kampf noch läuft
-            if any(p for p in player_team if not p.is_defeated) and any(o for o in opponent_team if not o.is_defeated):
-                self._display_team_status(player_team, "Spieler-Team", True)
-                self._display_team_status(opponent_team, "Gegner-Team", False)
-                time.sleep(SIMULATION_DELAY_BETWEEN_TURNS)
+            if players_alive and opponents_alive: # Kein erneuter Scan: Zähler sind auf dem Stand der letzten Aktion
+                if round_number % self.status_display_interval == 0:
+                    self._display_combat_status(player_team, opponent_team)
+                self._wait(SIMULATION_DELAY_BETWEEN_TURNS)
             else: # Kampf ist nach dieser Runde vorbei
                 break # Äußere while-Schleife (Runden) verlassen
 
@@ -272,12 +434,20 @@ class CLISimulationLoop:
         # Der return für Sieg/Niederlage geschieht schon in der Aktionsschleife
         return None # Fallback, sollte nicht erreicht werden, wenn Sieg/Niederlage korrekt behandelt wird
 
-    def _award_xp(self, surviving_team: List[CharacterInstance], defeated_team: List[CharacterInstance]):
-        total_xp_from_defeated_team = 0
-        for defeated_char in defeated_team:
-            if hasattr(defeated_char.base_template, 'xp_reward'):
-                total_xp_from_defeated_team += defeated_char.base_template.xp_reward
-        
+    @staticmethod
+    def _team_xp_reward(team: List[CharacterInstance]) -> int:
+        """Summe der XP-Belohnungen eines Teams (Templates ohne xp_reward zählen 0)."""
+        return sum(getattr(member.base_template, 'xp_reward', 0) for member in team)
+
+    def _award_xp(self, surviving_team: List[CharacterInstance], defeated_team: List[CharacterInstance],
+                  total_xp_from_defeated_team: Optional[int] = None):
+        """
+        Verteilt die XP des besiegten Teams gleichmäßig auf die Überlebenden.
+        total_xp_from_defeated_team kann vorab berechnet übergeben werden (sonst wird es hier summiert).
+        """
+        if total_xp_from_defeated_team is None:
+            total_xp_from_defeated_team = self._team_xp_reward(defeated_team)
+
         if total_xp_from_defeated_team == 0 or not surviving_team: return
         actual_survivors = [s for s in surviving_team if not s.is_defeated]
         if not actual_survivors: return 
@@ -292,7 +462,17 @@ class CLISimulationLoop:
     def start_simulation_loop(self, 
                               num_encounters: int = 1,
                               player_team_ids: Optional[List[str]] = None,
-                              opponent_setup_config: Optional[Dict[str, Any]] = None):
+                              opponent_setup_config: Optional[Dict[str, Any]] = None,
+                              fast_mode: Optional[bool] = None,
+                              parallel: int = 1):
+        """
+        Führt num_encounters Begegnungen nacheinander aus.
+        fast_mode: Wenn gesetzt, überschreibt es self.fast_mode (True = keine Pausen, z.B. für Batch-Läufe).
+        parallel: Anzahl Worker-Prozesse; Begegnungen sind unabhängig und laufen bei parallel > 1 im fast_mode
+                  gleichzeitig. Die Ausgabe jeder Begegnung wird gepuffert und in Reihenfolge ausgegeben.
+        """
+        if fast_mode is not None:
+            self.fast_mode = fast_mode
         if not self.character_templates or not self.opponent_templates:
             if not self._load_definitions_if_empty():
                 cli_output.print_message("Simulation kann nicht gestartet werden: Definitionen fehlen und konnten nicht geladen werden.", cli_output.Colors.RED)
@@ -304,21 +484,60 @@ class CLISimulationLoop:
         if opponent_setup_config is None:
             opponent_setup_config = {"num_opponents": 2, "level_pool": "1-2"}
 
+        if parallel > 1 and self.fast_mode and num_encounters > 1:
+            self._run_encounters_parallel(num_encounters, player_team_ids, opponent_setup_config, parallel)
+            cli_output.print_message("\nAlle Simulationen abgeschlossen.", cli_output.Colors.BOLD_LIGHT_BLUE)
+            return
+
         for i in range(num_encounters):
-            cli_output.print_message(f"\n{'='*15} Starte Begegnung Nr. {i+1} von {num_encounters} {'='*15}", cli_output.Colors.BOLD + cli_output.Colors.LIGHT_BLUE)
+            self._print_encounter_header(i, num_encounters)
             
             winner = self.run_combat_encounter(player_team_ids, opponent_setup_config)
             
-            if winner:
-                 cli_output.print_message(f"Sieger der Begegnung: Team '{winner}'", cli_output.Colors.LIGHT_GREEN if winner == "Spieler-Team" else cli_output.Colors.LIGHT_RED, bold=True)
-            else:
-                 cli_output.print_message("Begegnung endete unentschieden oder mit Fehler.", cli_output.Colors.YELLOW, bold=True)
+            self._print_encounter_result(winner)
 
             if i < num_encounters - 1:
                 cli_output.print_message("\nNächste Begegnung startet in Kürze...", cli_output.Colors.CYAN)
-                time.sleep(max(1.0, SIMULATION_DELAY_BETWEEN_TURNS)) # Kürzere Pause als zuvor
+                self._wait(max(1.0, SIMULATION_DELAY_BETWEEN_TURNS)) # Kürzere Pause als zuvor
         
-        cli_output.print_message("\nAlle Simulationen abgeschlossen.", cli_output.Colors.BOLD + cli_output.Colors.LIGHT_BLUE)
+        cli_output.print_message("\nAlle Simulationen abgeschlossen.", cli_output.Colors.BOLD_LIGHT_BLUE)
+
+    @staticmethod
+    def _print_encounter_header(index: int, num_encounters: int):
+        cli_output.print_message(f"\n{'='*15} Starte Begegnung Nr. {index+1} von {num_encounters} {'='*15}", cli_output.Colors.BOLD_LIGHT_BLUE)
+
+    @staticmethod
+    def _print_encounter_result(winner: Optional[str]):
+        if winner:
+             cli_output.print_message(f"Sieger der Begegnung: Team '{winner}'", cli_output.Colors.LIGHT_GREEN if winner == "Spieler-Team" else cli_output.Colors.LIGHT_RED, bold=True)
+        else:
+             cli_output.print_message("Begegnung endete unentschieden oder mit Fehler.", cli_output.Colors.YELLOW, bold=True)
+
+    def _run_encounters_parallel(self, num_encounters: int, player_team_ids: List[str],
+                                 opponent_setup_config: Dict[str, Any], parallel: int):
+        """
+        Verteilt unabhängige Begegnungen auf Worker-Prozesse und gibt ihre Ergebnisse in Reihenfolge aus.
+        Jeder Worker baut eine eigene Schleife mit den Templates dieser Instanz; Log-Einträge der Worker laufen
+        über eine Queue zurück und werden nur hier von den Handlern des Hauptprozesses geschrieben.
+        """
+        root_logger = logging.getLogger()
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+        init_args = (log_queue, root_logger.level, self.character_templates, self.opponent_templates,
+                     self.status_display_interval, self.status_changes_only)
+        job = (player_team_ids, opponent_setup_config)
+        logger.info("Starte %s Begegnungen parallel mit %s Worker-Prozessen.", num_encounters, parallel)
+        listener.start()
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=parallel, initializer=_init_encounter_worker,
+                                                        initargs=init_args) as executor:
+                for i, (winner, output) in enumerate(executor.map(_run_one_encounter, [job] * num_encounters)):
+                    self._print_encounter_header(i, num_encounters)
+                    if output:
+                        print(output, end="")
+                    self._print_encounter_result(winner)
+        finally:
+            listener.stop()
 
     def _load_definitions_if_empty(self) -> bool:
         """Versucht, Definitionen zu laden, falls sie leer sind. Gibt True bei Erfolg zurück."""
@@ -330,6 +549,41 @@ class CLISimulationLoop:
         return True
 
 
+# Simulationsschleife des aktuellen Worker-Prozesses (einmal pro Worker in _init_encounter_worker erstellt)
+_worker_simulation: Optional[CLISimulationLoop] = None
+
+def _init_encounter_worker(log_queue: Any, log_level: int,
+                           character_templates: Optional[Dict[str, CharacterTemplate]],
+                           opponent_templates: Optional[Dict[str, OpponentTemplate]],
+                           status_display_interval: int, status_changes_only: bool) -> None:
+    """
+    Initialisierung je Worker-Prozess: eigener Zufallszustand (per fork erzeugte Worker würden sonst identisch würfeln),
+    Logging nur über die Queue zum Hauptprozess (geerbte Datei-/Konsolen-Handler werden entfernt, damit nicht mehrere
+    Prozesse dieselbe Logdatei schreiben und rotieren) und eine Schleife mit den Templates des Hauptprozesses.
+    """
+    global _worker_simulation
+    random.seed()
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+
+    _worker_simulation = CLISimulationLoop(status_display_interval=status_display_interval,
+                                           character_templates=character_templates,
+                                           opponent_templates=opponent_templates,
+                                           fast_mode=True, status_changes_only=status_changes_only)
+
+def _run_one_encounter(job: Tuple[List[str], Dict[str, Any]]) -> Tuple[Optional[str], str]:
+    """Führt eine Begegnung mit der Schleife des Worker-Prozesses aus; gibt Sieger und die gepufferte Konsolenausgabe zurück."""
+    player_team_ids, opponent_setup_config = job
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        winner = _worker_simulation.run_combat_encounter(player_team_ids, opponent_setup_config)
+    return winner, output.getvalue()
+
+
 if __name__ == '__main__':
     try:
         import src.utils.logging_setup
@@ -2,9 +2,93 @@
 """
 Funktionen zur Anzeige von textbasierten Menüs und zur Abfrage von Benutzereingaben.
 """
-from typing import List, Tuple, Callable, Any, Optional
+import functools
+import sys
+from typing import List, Tuple, Callable, Any, Optional, Iterable
 from src.ui import cli_output # Für farbige Ausgaben
 
+# Einzige Quelle für Menü- und Zahleneingaben: (prompt, min_val, max_val) -> Eingabezeile.
+# Standardmäßig input(); set_input_source und set_input_provider ersetzen nur diesen Hook.
+# Jede Antwort durchläuft dieselbe Prüfung wie eine getippte Eingabe.
+InputHook = Callable[[str, Optional[int], Optional[int]], str]
+
+def _read_console(prompt: str, min_val: Optional[int] = None, max_val: Optional[int] = None) -> str:
+    return input(prompt)
+
+_input: InputHook = _read_console
+
+# Eingabe-Provider für automatisierte Läufe (Auto-Modus, Tests, RL-Harnesses): (prompt, min_val, max_val) -> int
+InputProvider = Callable[[str, Optional[int], Optional[int]], int]
+
+def set_input_provider(provider: Optional[InputProvider]) -> None:
+    """
+    Beantwortet Menü- und Zahleneingaben über provider statt über input(); None stellt input() wieder her.
+    Dünner Adapter auf den Eingabe-Hook: ungültige Antworten werden wie Tippfehler gemeldet und erneut erfragt.
+    """
+    global _input
+    if provider is None:
+        _input = _read_console
+        return
+
+    def _ask_provider(prompt: str, min_val: Optional[int] = None, max_val: Optional[int] = None) -> str:
+        return str(provider(prompt, min_val, max_val))
+
+    _input = _ask_provider
+
+def auto_input_provider(prompt: str, min_val: Optional[int] = None, max_val: Optional[int] = None) -> int:
+    """
+    Provider für den Auto-Modus: wählt ohne Rückfrage den kleinsten erlaubten Wert (in Menüs 0 = Zurück/Beenden),
+    damit ein unbeaufsichtigter Lauf nie auf eine Tastatureingabe wartet.
+    """
+    return min_val if min_val is not None else 0
+
+def set_input_source(lines: Optional[Iterable[str]]) -> None:
+    """
+    Liest Menü- und Zahleneingaben aus einem Zeilen-Iterable (z.B. offene Datei, sys.stdin, Liste) statt über input().
+    Umgeht die readline-Hooks von input() bei geskripteten Läufen; None stellt input() wieder her.
+    Ist die Quelle erschöpft, wird wie bei input() ein EOFError ausgelöst.
+    """
+    global _input
+    if lines is None:
+        _input = _read_console
+        return
+    line_iter = iter(lines)
+
+    def _read_line(prompt: str, min_val: Optional[int] = None, max_val: Optional[int] = None) -> str:
+        sys.stdout.write(prompt)
+        sys.stdout.flush() # Wie input(): Prompt erscheint vor dem Lesen der nächsten Zeile
+        try:
+            line = next(line_iter)
+        except StopIteration:
+            raise EOFError("Eingabequelle erschöpft") from None
+        return line.rstrip("\r\n")
+
+    _input = _read_line
+
+# Fehlermeldung für nicht-numerische Eingaben (einmalig definiert)
+_INVALID_NUMBER_MSG = "Ungültige Eingabe. Bitte eine Zahl eingeben."
+
+def _parse_int(text: str) -> Optional[int]:
+    """Wandelt eine Benutzereingabe ohne Exception-Kontrollfluss in eine Ganzzahl um; None bei ungültiger Eingabe."""
+    text = text.strip()
+    if not text.lstrip('+-').isdigit():
+        return None
+    try:
+        return int(text) # Sicherheitsnetz für Sonderfälle wie Unicode-Ziffern
+    except ValueError:
+        return None
+
+# Option 0 ist immer Zurück/Beenden; Zeile einmalig vorformatiert
+_MENU_FOOTER = f"{cli_output.Colors.YELLOW}0. Zurück / Beenden{cli_output.Colors.RESET}"
+
+@functools.lru_cache(maxsize=64)
+def _render_menu(title: str, descriptions: Tuple[str, ...]) -> str:
+    """Baut den kompletten Menütext (Titel, nummerierte Optionen, Fußzeile) einmal pro Titel/Optionen-Kombination."""
+    lines = [f"{cli_output.Colors.BOLD_CYAN}\n--- {title} ---{cli_output.Colors.RESET}"]
+    lines.extend(f"{i}. {description}" for i, description in enumerate(descriptions, 1))
+    lines.append(_MENU_FOOTER)
+    return "\n".join(lines)
+
 def display_menu(title: str, options: List[Tuple[str, Optional[Callable[[], Any]]]]) -> Any:
     """
     Zeigt ein nummeriertes Menü an und gibt das Ergebnis der ausgewählten Funktion zurück.
@@ -12,15 +96,14 @@ def display_menu(title: str, options: List[Tuple[str, Optional[Callable[[], Any]
              Wenn Funktion None ist, wird der Index+1 als Wert zurückgegeben (für Untermenüs).
              Wenn Funktion eine Callable ist, wird sie aufgerufen und ihr Ergebnis zurückgegeben.
     """
-    cli_output.print_message(f"\n--- {title} ---", cli_output.Colors.BOLD + cli_output.Colors.CYAN)
-    for i, (description, _) in enumerate(options):
-        cli_output.print_message(f"{i+1}. {description}")
-    cli_output.print_message("0. Zurück / Beenden", cli_output.Colors.YELLOW) # Option 0 ist immer Zurück/Beenden
+    print(_render_menu(title, tuple(description for description, _ in options)))
 
     while True:
         try:
-            choice_str = input(cli_output._c("Wähle eine Option: ", cli_output.Colors.LIGHT_GREEN))
-            choice = int(choice_str)
+            choice = _parse_int(_input(cli_output._c("Wähle eine Option: ", cli_output.Colors.LIGHT_GREEN), 0, len(options)))
+            if choice is None:
+                cli_output.print_message(_INVALID_NUMBER_MSG, cli_output.Colors.RED)
+                continue
             
             if choice == 0:
                 return "exit_menu" # Spezieller Rückgabewert für "Zurück/Beenden"
@@ -35,8 +118,6 @@ def display_menu(title: str, options: List[Tuple[str, Optional[Callable[[], Any]
                     return func_or_value
             else:
                 cli_output.print_message("Ungültige Auswahl. Bitte erneut versuchen.", cli_output.Colors.RED)
-        except ValueError:
-            cli_output.print_message("Ungültige Eingabe. Bitte eine Zahl eingeben.", cli_output.Colors.RED)
         except Exception as e:
              cli_output.print_message(f"Ein Fehler ist aufgetreten: {e}", cli_output.Colors.RED)
              return "error"
@@ -45,8 +126,10 @@ def get_user_input_int(prompt: str, min_val: Optional[int] = None, max_val: Opti
     """Fragt den Benutzer nach einer Ganzzahleingabe mit optionalen Grenzen."""
     while True:
         try:
-            val_str = input(cli_output._c(f"{prompt} ", cli_output.Colors.LIGHT_GREEN))
-            val = int(val_str)
+            val = _parse_int(_input(cli_output._c(f"{prompt} ", cli_output.Colors.LIGHT_GREEN), min_val, max_val))
+            if val is None:
+                cli_output.print_message(_INVALID_NUMBER_MSG, cli_output.Colors.RED)
+                continue
             if min_val is not None and val < min_val:
                 cli_output.print_message(f"Eingabe muss mindestens {min_val} sein.", cli_output.Colors.RED)
                 continue
@@ -54,8 +137,6 @@ def get_user_input_int(prompt: str, min_val: Optional[int] = None, max_val: Opti
                 cli_output.print_message(f"Eingabe darf höchstens {max_val} sein.", cli_output.Colors.RED)
                 continue
             return val
-        except ValueError:
-            cli_output.print_message("Ungültige Eingabe. Bitte eine Zahl eingeben.", cli_output.Colors.RED)
         except KeyboardInterrupt: 
             cli_output.print_message("\nEingabe abgebrochen.", cli_output.Colors.YELLOW)
             return None
@@ -3,6 +3,7 @@
 Modul für formatierte Kommandozeilen-Ausgaben für die RPG-Simulation.
 """
 import logging
+import functools
 from typing import List, Optional, Dict, Any
 
 # Importe für Typ-Annotationen (falls komplexere Objekte formatiert werden)
@@ -39,81 +40,132 @@ class Colors:
     LIGHT_MAGENTA = "\033[95m"
     LIGHT_CYAN = "\033[96m"
 
+    # Vorberechnete Kombinationen mit Fettschrift (einmal beim Import statt Verkettung bei jedem Aufruf).
+    # Reihenfolge der Codes wie an den bisherigen Aufrufstellen: FARBE_BOLD = Farbe+Fett, BOLD_FARBE = Fett+Farbe.
+    RED_BOLD = RED + BOLD
+    GREEN_BOLD = GREEN + BOLD
+    YELLOW_BOLD = YELLOW + BOLD
+    CYAN_BOLD = CYAN + BOLD
+    LIGHT_RED_BOLD = LIGHT_RED + BOLD
+    LIGHT_GREEN_BOLD = LIGHT_GREEN + BOLD
+    LIGHT_YELLOW_BOLD = LIGHT_YELLOW + BOLD
+    BOLD_YELLOW = BOLD + YELLOW
+    BOLD_CYAN = BOLD + CYAN
+    BOLD_LIGHT_GREEN = BOLD + LIGHT_GREEN
+    BOLD_LIGHT_BLUE = BOLD + LIGHT_BLUE
+
     # Hintergrundfarben (seltener verwendet für CLI-Log)
     # BG_RED = "\033[41m"
     # BG_GREEN = "\033[42m"
 
 USE_COLORS = True # Globale Einstellung, um Farben an-/abzuschalten
+_RESET = Colors.RESET # Modulglobal statt Klassenattribut-Lookup bei jeder Ausgabe
+
+@functools.lru_cache(maxsize=512)
+def _colorize(text: str, color_code: str) -> str:
+    """Umschließt text mit Farbcode und Reset; wiederkehrende Kombinationen (Menütexte, Namen) kommen aus dem Cache."""
+    return f"{color_code}{text}{_RESET}"
 
 def _c(text: str, color_code: str) -> str:
     """Hilfsfunktion zum Anwenden von Farben, wenn USE_COLORS True ist."""
-    return f"{color_code}{text}{Colors.RESET}" if USE_COLORS else text
+    # USE_COLORS wird bei jedem Aufruf geprüft, damit Umschalten zur Laufzeit nicht vom Cache verdeckt wird
+    return _colorize(text, color_code) if USE_COLORS else text
 
-def print_message(message: str, color: Optional[str] = None, bold: bool = False, underline: bool = False):
-    """Gibt eine formatierte Nachricht auf der Konsole aus."""
+def format_message(message: str, color: Optional[str] = None, bold: bool = False, underline: bool = False) -> str:
+    """Formatiert eine Nachricht mit Farbe/Stil, ohne sie auszugeben (z.B. für gebündelte Ausgaben)."""
     prefix = ""
     if bold: prefix += Colors.BOLD
     if underline: prefix += Colors.UNDERLINE
     
-    output_message = message
     if color:
-        output_message = f"{prefix}{color}{message}{Colors.RESET}"
+        return f"{prefix}{color}{message}{_RESET}"
     elif prefix: # Nur Bold/Underline ohne Farbe
-        output_message = f"{prefix}{message}{Colors.RESET}"
-        
-    print(output_message)
+        return f"{prefix}{message}{_RESET}"
+    return message
+
+def print_message(message: str, color: Optional[str] = None, bold: bool = False, underline: bool = False):
+    """Gibt eine formatierte Nachricht auf der Konsole aus."""
+    print(format_message(message, color, bold, underline))
     # Zusätzlich ins Logging, aber nur die reine Nachricht ohne ANSI-Codes
     # logger.info(message) # Oder je nach Kontext einen anderen Log-Level
 
-def display_character_status(char_instance: 'CharacterInstance', is_player_team: bool = True):
-    """Zeigt den Status einer Charakterinstanz an."""
-    color = Colors.LIGHT_GREEN if is_player_team else Colors.LIGHT_RED
-    name_str = _c(f"{char_instance.name} (Lvl {char_instance.level})", color + Colors.BOLD)
-    
-    hp_color = Colors.GREEN
-    if char_instance.current_hp / char_instance.max_hp < 0.3:
-        hp_color = Colors.RED
-    elif char_instance.current_hp / char_instance.max_hp < 0.6:
-        hp_color = Colors.YELLOW
-        
-    hp_str = _c(f"HP: {char_instance.current_hp}/{char_instance.max_hp}", hp_color)
-    shield_str = _c(f"Schild: {char_instance.shield_points}", Colors.CYAN) if char_instance.shield_points > 0 else ""
+# Vorlagen für die Statuszeile; Farbcodes werden als Felder eingesetzt (bei USE_COLORS=False leer)
+_STATUS_HEAD_TMPL = "{name_c}{name} (Lvl {level}){reset} | {hp_c}HP: {hp}/{max_hp}{reset}"
+_STATUS_PART_TMPL = " | {0}{1}: {2}{3}"
+_STATUS_POOL_TMPL = " | {0}{1}: {2}/{3}{4}"
+
+def _hp_color(hp_ratio: float) -> str:
+    """Farbe der HP-Anzeige: rot unter 30 %, gelb unter 60 %, sonst grün."""
+    if hp_ratio < 0.3:
+        return Colors.RED
+    if hp_ratio < 0.6:
+        return Colors.YELLOW
+    return Colors.GREEN
+
+def format_character_status(char_instance: 'CharacterInstance', is_player_team: bool = True) -> str:
+    """Baut den Statusblock einer Charakterinstanz (eine oder mehrere Zeilen) als String."""
+    use_colors = USE_COLORS
+    reset = _RESET if use_colors else ""
+    current_hp, max_hp = char_instance.current_hp, char_instance.max_hp
+    hp_ratio = current_hp / max_hp if max_hp > 0 else 0.0 # Nur einmal berechnen
+
+    status_line = _STATUS_HEAD_TMPL.format_map({
+        "name_c": (Colors.LIGHT_GREEN_BOLD if is_player_team else Colors.LIGHT_RED_BOLD) if use_colors else "",
+        "name": char_instance.name, "level": char_instance.level,
+        "hp_c": _hp_color(hp_ratio) if use_colors else "",
+        "hp": current_hp, "max_hp": max_hp, "reset": reset,
+    })
+    if char_instance.shield_points > 0:
+        status_line += _STATUS_PART_TMPL.format(Colors.CYAN if use_colors else "", "Schild", char_instance.shield_points, reset)
 
     # Ressourcen anzeigen (Mana, Stamina, Energy)
-    resources = []
     if char_instance.max_mana > 0:
-        resources.append(_c(f"Mana: {char_instance.current_mana}/{char_instance.max_mana}", Colors.BLUE))
+        status_line += _STATUS_POOL_TMPL.format(Colors.BLUE if use_colors else "", "Mana", char_instance.current_mana, char_instance.max_mana, reset)
     if char_instance.max_stamina > 0:
-        resources.append(_c(f"Stamina: {char_instance.current_stamina}/{char_instance.max_stamina}", Colors.YELLOW))
+        status_line += _STATUS_POOL_TMPL.format(Colors.YELLOW if use_colors else "", "Stamina", char_instance.current_stamina, char_instance.max_stamina, reset)
     if char_instance.max_energy > 0:
-        resources.append(_c(f"Energy: {char_instance.current_energy}/{char_instance.max_energy}", Colors.MAGENTA))
-    
-    resource_str = " | ".join(r for r in resources if r)
-
-    status_line = f"{name_str} | {hp_str}"
-    if shield_str:
-        status_line += f" | {shield_str}"
-    if resource_str:
-        status_line += f" | {resource_str}"
+        status_line += _STATUS_POOL_TMPL.format(Colors.MAGENTA if use_colors else "", "Energy", char_instance.current_energy, char_instance.max_energy, reset)
 
-    print(status_line)
+    lines = [status_line]
 
     # Status-Effekte anzeigen
     if char_instance.status_effects:
-        effects_str_parts = []
-        for effect in char_instance.status_effects:
-            eff_color = Colors.LIGHT_GREEN if effect.is_positive else Colors.LIGHT_RED
-            effects_str_parts.append(_c(f"{effect.name}({effect.current_potency:.0f}, {effect.remaining_duration}R)", eff_color))
-        print(f"  └ Effekte: {', '.join(effects_str_parts)}")
+        effects_str_parts = [
+            _c(f"{effect.name}({effect.current_potency:.0f}, {effect.remaining_duration}R)",
+               Colors.LIGHT_GREEN if effect.is_positive else Colors.LIGHT_RED)
+            for effect in char_instance.status_effects
+        ]
+        lines.append(f"  └ Effekte: {', '.join(effects_str_parts)}")
     
     if char_instance.is_defeated:
-        print(_c("  └ BESIEGT", Colors.RED + Colors.BOLD))
+        lines.append(_c("  └ BESIEGT", Colors.RED_BOLD))
+
+    return "\n".join(lines)
+
+def display_character_status(char_instance: 'CharacterInstance', is_player_team: bool = True):
+    """Zeigt den Status einer Charakterinstanz an (ein einziger print-Aufruf)."""
+    print(format_character_status(char_instance, is_player_team))
+
+def format_team_status(team: List['CharacterInstance'], is_player_team: bool = True, title: Optional[str] = None) -> str:
+    """Baut den Statusblock eines Teams (optional mit fettem Titel) als String; leer, wenn es nichts anzuzeigen gibt."""
+    lines = [format_message(title, bold=True)] if title else []
+    lines.extend(format_character_status(member, is_player_team) for member in team)
+    return "\n".join(lines)
+
+def display_team_status(team: List['CharacterInstance'], is_player_team: bool = True, title: Optional[str] = None):
+    """
+    Zeigt den Status aller Mitglieder eines Teams gebündelt mit einem print-Aufruf an.
+    Ein optionaler Titel wird fett vorangestellt und im selben Aufruf ausgegeben.
+    """
+    block = format_team_status(team, is_player_team, title)
+    if block:
+        print(block)
 
 
 def display_combat_action(actor_name: str, skill_name: str, target_name: Optional[str], details: str = ""):
     """Zeigt eine durchgeführte Kampfaktion an."""
     actor_c = _c(actor_name, Colors.LIGHT_YELLOW)
-    skill_c = _c(skill_name, Colors.CYAN + Colors.BOLD)
+    skill_c = _c(skill_name, Colors.CYAN_BOLD)
     
     if target_name:
         target_c = _c(target_name, Colors.LIGHT_MAGENTA)
@@ -129,7 +181,7 @@ def display_combat_action(actor_name: str, skill_name: str, target_name: Optiona
 def display_damage_taken(target_name: str, damage_amount: int, damage_type: str, new_hp: int, max_hp: int, absorbed_by_shield: int = 0):
     """Zeigt erlittenen Schaden an."""
     target_c = _c(target_name, Colors.LIGHT_MAGENTA)
-    damage_c = _c(str(damage_amount), Colors.RED + Colors.BOLD)
+    damage_c = _c(str(damage_amount), Colors.RED_BOLD)
     type_c = _c(damage_type.upper(), Colors.RED)
     
     absorbed_str = ""
@@ -141,7 +193,7 @@ def display_damage_taken(target_name: str, damage_amount: int, damage_type: str,
 def display_healing_received(target_name: str, heal_amount: int, new_hp: int, max_hp: int):
     """Zeigt erhaltene Heilung an."""
     target_c = _c(target_name, Colors.LIGHT_MAGENTA)
-    heal_c = _c(str(heal_amount), Colors.GREEN + Colors.BOLD)
+    heal_c = _c(str(heal_amount), Colors.GREEN_BOLD)
     print(f"{target_c} wird um {heal_c} HP geheilt! (HP: {new_hp}/{max_hp})")
 
 def display_status_effect_applied(target_name: str, effect_name: str, duration: int):
@@ -166,16 +218,19 @@ def display_miss(actor_name: str, target_name: str, skill_name: Optional[str] =
     else:
         print(f"{actor_c} verfehlt {target_c}.")
         
-def display_combat_round_start(round_number: int):
-    """Zeigt den Beginn einer neuen Kampfrunde an."""
-    print_message(f"\n--- Runde {round_number} beginnt ---", Colors.BOLD + Colors.YELLOW)
+def display_combat_round_start(round_number: int, initiative_names: Optional[List[str]] = None):
+    """Zeigt den Beginn einer neuen Kampfrunde an, optional zusammen mit der Initiative-Reihenfolge (ein print-Aufruf)."""
+    header = format_message(f"\n--- Runde {round_number} beginnt ---", Colors.BOLD_YELLOW)
+    if initiative_names is not None:
+        header += "\n" + format_message(f"Initiative-Reihenfolge: {', '.join(initiative_names)}", Colors.CYAN)
+    print(header)
 
 def display_combat_end(victory_team_name: Optional[str] = None):
     """Zeigt das Ende des Kampfes an."""
     if victory_team_name:
-        print_message(f"\n=== KAMPF BEENDET - Team '{victory_team_name}' hat gewonnen! ===", Colors.BOLD + Colors.LIGHT_GREEN)
+        print_message(f"\n=== KAMPF BEENDET - Team '{victory_team_name}' hat gewonnen! ===", Colors.BOLD_LIGHT_GREEN)
     else:
-        print_message("\n=== KAMPF BEENDET (Unentschieden oder unbekannter Ausgang) ===", Colors.BOLD + Colors.YELLOW)
+        print_message("\n=== KAMPF BEENDET (Unentschieden oder unbekannter Ausgang) ===", Colors.BOLD_YELLOW)
 
 def display_xp_gain(character_name: str, xp_amount: int):
     """Zeigt erhaltene Erfahrungspunkte an."""
@@ -185,9 +240,9 @@ def display_xp_gain(character_name: str, xp_amount: int):
 
 def display_level_up(character_name: str, new_level: int):
     """Zeigt einen Levelaufstieg an."""
-    char_c = _c(character_name, Colors.LIGHT_GREEN + Colors.BOLD)
-    level_c = _c(str(new_level), Colors.YELLOW + Colors.BOLD)
-    print_message(f"LEVEL UP! {char_c} hat Level {level_c} erreicht!", Colors.BOLD + Colors.YELLOW)
+    char_c = _c(character_name, Colors.LIGHT_GREEN_BOLD)
+    level_c = _c(str(new_level), Colors.YELLOW_BOLD)
+    print_message(f"LEVEL UP! {char_c} hat Level {level_c} erreicht!", Colors.BOLD_YELLOW)
 
 if __name__ == '__main__':
     # Testen der cli_output Funktionen
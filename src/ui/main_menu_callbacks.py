@@ -5,6 +5,7 @@ Diese Funktionen implementieren die Logik hinter den Menüauswahlen.
 """
 import logging
 import os
+import copy
 import json 
 import json5 
 import subprocess # Für den Aufruf externer Skripte als Alternative
@@ -42,6 +43,12 @@ logger = logging.getLogger(__name__)
 
 _current_selected_rl_setup_file_callbacks: Optional[str] = None
 
+# Fallback-Simulationseinstellungen, falls in den user_preferences nichts Gültiges steht.
+# Nur lesen; wer die Werte verändern will, muss eine Kopie (copy.deepcopy) verwenden.
+_FALLBACK_SIM_SETTINGS: Dict[str, Any] = {"num_encounters": 1, "player_hero_id": "krieger",
+                                          "opponent_config": {"num_opponents": 1, "level_pool": "1-2"}}
+_FALLBACK_HERO_IDS = ("krieger", "magier", "schurke", "kleriker")
+
 def initialize_menu_callbacks(ucm: UserConfigManager):
     global _current_selected_rl_setup_file_callbacks
     _current_selected_rl_setup_file_callbacks = ucm.get_preference("last_selected_rl_setup_file")
@@ -58,8 +65,7 @@ def start_auto_simulation_with_user_settings_callback(ucm: UserConfigManager,
     sim_settings = ucm.get_preference("simulation_settings")
     if not sim_settings or not isinstance(sim_settings, dict): 
         logger.error("Ungültige oder fehlende Simulationseinstellungen in user_preferences für start_auto_simulation.")
-        sim_settings = {"num_encounters": 1, "player_hero_id": "krieger", 
-                        "opponent_config": {"num_opponents": 1, "level_pool": "1-2"}}
+        sim_settings = copy.deepcopy(_FALLBACK_SIM_SETTINGS)
     
     cli_output.print_message("\nStarte automatische Simulation mit aktuellen Benutzereinstellungen:", cli_output.Colors.CYAN)
     cli_output.print_message(f"  Anzahl Begegnungen: {sim_settings.get('num_encounters', 1)}")
@@ -69,11 +75,15 @@ def start_auto_simulation_with_user_settings_callback(ucm: UserConfigManager,
     cli_output.print_message(f"  Gegner-Level-Pool: {opp_conf.get('level_pool', '1-2')}")
     
     try:
-        simulation = clsm_type() 
+        parallel = sim_settings.get('parallel_encounters', 1)
+        simulation = clsm_type(status_display_interval=sim_settings.get('status_display_interval', 1),
+                               fast_mode=parallel > 1, # Parallele Begegnungen laufen immer ohne Pausen
+                               status_changes_only=sim_settings.get('status_changes_only', False)) 
         simulation.start_simulation_loop(
             num_encounters=sim_settings.get('num_encounters', 1),
             player_team_ids=[sim_settings.get('player_hero_id', 'krieger')],
-            opponent_setup_config=opp_conf
+            opponent_setup_config=opp_conf,
+            parallel=parallel
         )
     except Exception as e:
         logger.error(f"Fehler während der CLI-Simulation (Callback): {e}", exc_info=True)
@@ -95,15 +105,16 @@ def configure_simulation_settings_menu_callback(ucm: UserConfigManager,
         if not available_heroes: raise ValueError("Keine Helden-Templates geladen.")
     except Exception as e:
         logger.error(f"Fehler beim Laden der Charakter-Templates für Menü-Callback: {e}")
-        available_heroes = ["krieger", "magier", "schurke", "kleriker"] 
+        available_heroes = list(_FALLBACK_HERO_IDS)
         cli_output.print_message("WARNUNG: Konnte Charakter-Templates nicht laden, verwende Standardheldenliste.", cli_output.Colors.YELLOW)
+    known_hero_ids = frozenset(available_heroes) # Für Gültigkeitsprüfungen; die Liste behält die Anzeigereihenfolge
 
     def get_current_sim_settings_for_display() -> Dict[str, Any]:
-        defaults = {"num_encounters": 1, "player_hero_id": "krieger", 
-                    "opponent_config": {"num_opponents": 1, "level_pool": "1-2"}}
-        current = ucm.get_preference("simulation_settings", defaults)
+        current = ucm.get_preference("simulation_settings")
+        if not isinstance(current, dict):
+            return copy.deepcopy(_FALLBACK_SIM_SETTINGS) # Kopie nur im Fallback-Fall
         if not isinstance(current.get("opponent_config"), dict): 
-            current["opponent_config"] = defaults["opponent_config"]
+            current["opponent_config"] = dict(_FALLBACK_SIM_SETTINGS["opponent_config"])
         return current
 
     def change_encounters():
@@ -127,7 +138,7 @@ def configure_simulation_settings_menu_callback(ucm: UserConfigManager,
             hero_options.append((f"{hero_id} ({hero_name})", lambda hid=hero_id: hid)) 
         
         chosen_hero_id_from_menu = cli_menu.display_menu(f"Spieler-Held auswählen (Aktuell: {current_val})", hero_options)
-        if chosen_hero_id_from_menu and chosen_hero_id_from_menu != "exit_menu" and chosen_hero_id_from_menu in available_heroes:
+        if chosen_hero_id_from_menu and chosen_hero_id_from_menu != "exit_menu" and chosen_hero_id_from_menu in known_hero_ids:
             ucm.set_preference("simulation_settings.player_hero_id", chosen_hero_id_from_menu)
             cli_output.print_message(f"Spieler-Held auf '{chosen_hero_id_from_menu}' gesetzt.", cli_output.Colors.LIGHT_GREEN)
 
@@ -223,9 +234,12 @@ def configure_rl_menu_callback(ucm: UserConfigManager):
             try:
                 with open(current_file_to_view, 'r', encoding='utf-8') as f:
                     content = json5.load(f) 
-                cli_output.print_message(f"\n--- Inhalt von '{current_file_to_view}' ---", cli_output.Colors.BOLD)
-                cli_output.print_message(json.dumps(content, indent=2, ensure_ascii=False)) 
-                cli_output.print_message("--- Ende des Inhalts ---", cli_output.Colors.BOLD)
+                # Kopfzeile, Inhalt und Fußzeile als ein Block ausgeben
+                print("\n".join([
+                    cli_output.format_message(f"\n--- Inhalt von '{current_file_to_view}' ---", cli_output.Colors.BOLD),
+                    json.dumps(content, indent=2, ensure_ascii=False),
+                    cli_output.format_message("--- Ende des Inhalts ---", cli_output.Colors.BOLD)
+                ]))
             except Exception as e:
                 logger.error(f"Fehler beim Lesen/Anzeigen der RL-Setup-Datei '{current_file_to_view}': {e}")
                 cli_output.print_message(f"Konnte RL-Setup-Datei nicht anzeigen: {e}", cli_output.Colors.RED)